@@ -0,0 +1,175 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Generates synthetic data files of any size for the benchmarks
+
+reservations.txt (Task C and G):
+201|Moomin Valley|moomin@whitevalley.org|0509876543|2025-11-12|09:00|2|18.50|True|Forest Area 1|2025-08-12 14:33:20
+
+weekNN.csv (Task D and E), one file per 168 hours:
+Time;Consumption phase 1 Wh;...;Production phase 3 Wh
+2025-10-06T00:00:00;442;112;27;0;0;0
+
+2025.csv (Task F), hourly rows with the Finnish UTC offset:
+Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature
+2025-01-01T00:00:00.000+02:00;1,569;0,000;-4,5
+
+The same seed always gives the same files.
+
+python generate_data.py reservations|weeks|energy rows target
+"""
+
+import math
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+RESOURCES = ["Forest Area 1", "Flower Room", "Red Room", "Storage Area N", "Botanical Lab"]
+
+WEEK_HEADER = (
+    "Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+    "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh\n"
+)
+
+ENERGY_HEADER = "Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature\n"
+
+HOURS_PER_WEEK = 7 * 24
+
+
+def write_reservations(filename: str, rows: int, seed: int = 42) -> None:
+    """
+    Writes random reservations in the format of reservations.txt
+
+    Parameters:
+     filename (str): File to create
+     rows (int): Number of reservations
+     seed (int): Seed of the random numbers
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    with open(filename, "w", encoding="utf-8") as f:
+        for i in range(rows):
+            reserved = start + timedelta(days=rng.randrange(365))
+            created = reserved - timedelta(seconds=rng.randrange(200 * 86400))
+            f.write(
+                f"{i + 1}|Customer {i}|customer{i}@example.com|040{i % 10 ** 7:07d}"
+                f"|{reserved:%Y-%m-%d}|{rng.randrange(8, 20):02d}:{rng.choice([0, 15, 30, 45]):02d}"
+                f"|{rng.randint(1, 6)}|{rng.randint(1000, 5000) / 100:.2f}"
+                f"|{rng.choice(['True', 'False'])}|{rng.choice(RESOURCES)}"
+                f"|{created:%Y-%m-%d %H:%M:%S}\n"
+            )
+
+
+def write_week_files(folder: str, rows: int, seed: int = 42) -> list[str]:
+    """
+    Writes hourly phase data in the weekNN.csv format, 168 rows per file
+
+    The weeks follow each other from Monday 2025-01-06, and the files are
+    numbered week1.csv, week2.csv, ... The last file is shorter if rows is
+    not a multiple of 168.
+
+    Parameters:
+     folder (str): Folder of the files
+     rows (int): Number of hourly rows in all files together
+     seed (int): Seed of the random numbers
+
+    Returns:
+     files (list[str]): Names of the created files
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 6)
+    files = []
+    for week in range(math.ceil(rows / HOURS_PER_WEEK)):
+        filename = os.path.join(folder, f"week{week + 1}.csv")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(WEEK_HEADER)
+            for hour in range(min(HOURS_PER_WEEK, rows - week * HOURS_PER_WEEK)):
+                moment = start + timedelta(weeks=week, hours=hour)
+                sun = max(0.0, math.sin(math.pi * (moment.hour - 6) / 12))
+                consumption = [rng.randrange(20, 600) for _ in range(3)]
+                production = [int(sun * rng.randrange(0, 1200)) for _ in range(3)]
+                f.write(f"{moment.isoformat()};{';'.join(map(str, consumption + production))}\n")
+        files.append(filename)
+    return files
+
+
+def last_sunday(year: int, month: int) -> date:
+    """Returns the last Sunday of a month"""
+    day = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def helsinki_offset(utc: datetime) -> int:
+    """
+    Returns the UTC offset of Finnish time in hours at a UTC moment
+
+    Summer time (UTC+3) starts on the last Sunday of March at 01:00 UTC
+    and ends on the last Sunday of October at 01:00 UTC.
+    """
+    summer_starts = datetime.combine(last_sunday(utc.year, 3), datetime.min.time()) + timedelta(hours=1)
+    summer_ends = datetime.combine(last_sunday(utc.year, 10), datetime.min.time()) + timedelta(hours=1)
+    return 3 if summer_starts <= utc < summer_ends else 2
+
+
+def decimal_comma(value: float, decimals: int) -> str:
+    """Formats a number with a decimal comma, e.g. -4,5"""
+    return f"{value:.{decimals}f}".replace(".", ",")
+
+
+def write_energy_file(filename: str, rows: int, seed: int = 42) -> None:
+    """
+    Writes hourly energy data in the format of 2025.csv
+
+    The rows start at 2025-01-01 00:00 local time and continue hour by hour
+    over the following years, with the summer-time changes of Finnish time.
+
+    Parameters:
+     filename (str): File to create
+     rows (int): Number of hourly rows
+     seed (int): Seed of the random numbers
+    """
+    rng = random.Random(seed)
+    utc = datetime(2024, 12, 31, 22)
+    day = None
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(ENERGY_HEADER)
+        for _ in range(rows):
+            offset = helsinki_offset(utc)
+            local = utc + timedelta(hours=offset)
+            if local.date() != day:
+                # Daily average temperature and the length of the day follow the season
+                day = local.date()
+                season = -math.cos(2 * math.pi * (day.timetuple().tm_yday - 20) / 365)
+                temperature = 5 + 15 * season + rng.uniform(-5, 5)
+            sun = max(0.0, math.sin(math.pi * (local.hour - 6) / 12)) * (season + 1) / 2
+            f.write(
+                f"{local:%Y-%m-%dT%H:%M:%S}.000+0{offset}:00;{decimal_comma(rng.uniform(0.3, 2.5), 3)};"
+                f"{decimal_comma(sun * rng.uniform(0, 3), 3)};{decimal_comma(temperature, 1)}\n"
+            )
+            utc += timedelta(hours=1)
+
+
+def main():
+    """Writes one data file from the command line"""
+    if len(sys.argv) != 4 or sys.argv[1] not in ("reservations", "weeks", "energy"):
+        print("Usage: python generate_data.py reservations|weeks|energy rows target")
+        sys.exit(1)
+    kind, rows, target = sys.argv[1], int(float(sys.argv[2])), sys.argv[3]
+    if kind == "reservations":
+        write_reservations(target, rows)
+    elif kind == "weeks":
+        os.makedirs(target, exist_ok=True)
+        print(f"{len(write_week_files(target, rows))} week files written to {target}")
+    else:
+        write_energy_file(target, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Times the parsing, the report functions and the report writers of
+Task E, F and G on generated data of different sizes
+
+The data files are generated with generate_data.py to a temporary folder.
+Every step is run --repeat times and the best time is kept. The results
+are saved as JSON, and a previous result file can be given with --compare
+to see which steps got slower:
+
+python run_benchmarks.py [--sizes 1e3,1e4,1e5] [--groups reservations,energy,weeks]
+                         [--repeat 3] [--output results.json]
+                         [--compare old.json] [--threshold 1.25]
+                         [--max-rows 1e6]
+
+Each group and size is timed in its own Python process, which has only the
+folder of its task (and Tasks/Common) on sys.path. The tasks have modules
+with the same names, and a fresh process also keeps the caches of one run
+from speeding up the next.
+
+The reservations and energy steps keep every row in memory as Python
+objects, about 500 bytes per reservation, so sizes above --max-rows are
+skipped for them. The week files are summed one file at a time and are
+not limited.
+
+The program exits with status 1 if some step is slower than the
+threshold times its time in the compared file.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+from generate_data import write_energy_file, write_reservations, write_week_files
+
+TASKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(os.path.join(TASKS, "Common"))
+from instrumentation import best_time  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:  # The NumPy steps are skipped without it
+    np = None
+
+# Group -> task folder whose modules it times
+GROUPS = {"reservations": "TaskG", "energy": "TaskF", "weeks": "TaskE"}
+# Groups that keep all rows in memory
+IN_MEMORY_GROUPS = ["reservations", "energy"]
+MAX_ROWS = 1_000_000
+
+
+def use_task(group: str) -> None:
+    """
+    Puts the task folder of a group first on sys.path
+
+    Only called in the process that times the group, so the modules of the
+    other tasks are never imported there.
+    """
+    sys.path.insert(0, os.path.join(TASKS, GROUPS[group]))
+
+
+def quiet_best_time(function, repeat: int) -> float:
+    """
+    Runs a function repeat times with best_time() and the console output hidden
+
+    Returns:
+     (float): The shortest run time in seconds
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        return best_time(function, repeat=repeat)[1]
+
+
+def reservation_steps(folder: str, rows: int) -> dict:
+    """
+    Generates a reservations file and returns the steps to time
+
+    Parameters:
+     folder (str): Folder of the generated files
+     rows (int): Number of reservations
+
+    Returns:
+     steps (dict): Step name -> function without parameters
+    """
+    from read_reservations import (
+        confirmation_statuses,
+        confirmation_summary,
+        confirmed_reservations,
+        fetch_reservations,
+        long_reservations,
+        total_revenue,
+    )
+    from report_engine import build_report, iter_reservations
+    from report_output import ReportWriter, write_report
+
+    filename = os.path.join(folder, "reservations.txt")
+    write_reservations(filename, rows)
+    reservations = fetch_reservations(filename)
+    report = build_report(iter_reservations(filename))
+    output = os.path.join(folder, "report.out")
+
+    def write(output_format: str):
+        with open(output, "w", encoding="utf-8", newline="") as stream:
+            with ReportWriter(stream, output_format) as writer:
+                write_report(report, writer)
+
+    return {
+        "fetch_reservations": lambda: fetch_reservations(filename),
+        "confirmed_reservations": lambda: confirmed_reservations(reservations),
+        "long_reservations": lambda: long_reservations(reservations),
+        "confirmation_statuses": lambda: confirmation_statuses(reservations),
+        "confirmation_summary": lambda: confirmation_summary(reservations),
+        "total_revenue": lambda: total_revenue(reservations),
+        "build_report": lambda: build_report(iter_reservations(filename)),
+        "write_report_text": lambda: write("text"),
+        "write_report_csv": lambda: write("csv"),
+        "write_report_json": lambda: write("json"),
+    }
+
+
+def energy_steps(folder: str, rows: int) -> dict:
+    """
+    Generates an hourly energy file and returns the steps to time
+
+    Parameters:
+     folder (str): Folder of the generated files
+     rows (int): Number of hourly rows
+    """
+    from energy_index import EnergyIndex
+    from energy_loader import load_energy_arrays, read_data
+    from energy_reports import create_daily_report, create_monthly_report, create_yearly_report, write_report_to_file
+    from energy_rollup import read_rollups
+    from energy_scanner import scan_file
+    from energy_timestamps import load_zoned_arrays
+
+    filename = os.path.join(folder, "energy.csv")
+    write_energy_file(filename, rows)
+    index = EnergyIndex.from_rows(read_data(filename))
+    first, last = index.first_day(), index.last_day()
+    lines = create_daily_report(index, first, last)
+    output = os.path.join(folder, "report.txt")
+
+    steps = {
+        "read_data": lambda: read_data(filename),
+        "EnergyIndex.from_rows": lambda: EnergyIndex.from_rows(read_data(filename)),
+        "create_daily_report": lambda: create_daily_report(index, first, last),
+        "create_monthly_report": lambda: create_monthly_report(index, first.month, first.year),
+        "create_yearly_report": lambda: create_yearly_report(index, first.year),
+        "write_report_to_file": lambda: write_report_to_file(lines, output),
+    }
+    if np is not None:
+        steps["load_energy_arrays"] = lambda: load_energy_arrays(filename)
+        steps["scan_file"] = lambda: scan_file(filename)
+        steps["load_zoned_arrays"] = lambda: load_zoned_arrays(filename)
+        steps["read_rollups"] = lambda: read_rollups(filename)
+    return steps
+
+
+def week_steps(folder: str, rows: int) -> dict:
+    """
+    Generates weekNN.csv files and returns the steps to time
+
+    Parameters:
+     folder (str): Folder of the generated files
+     rows (int): Number of hourly rows in all week files together
+    """
+    from weekly_summary import build_summary, find_week_files, summarize_weeks, write_summary
+
+    week_folder = os.path.join(folder, "weeks")
+    os.makedirs(week_folder)
+    write_week_files(week_folder, rows)
+    files = find_week_files([week_folder])
+    summaries = summarize_weeks(files, 1)
+    lines = build_summary(summaries)
+    output = os.path.join(folder, "summary.txt")
+    return {
+        "summarize_weeks": lambda: summarize_weeks(files, 1),
+        "build_summary": lambda: build_summary(summaries),
+        "write_summary": lambda: write_summary(lines, output),
+    }
+
+
+STEPS = {"reservations": reservation_steps, "energy": energy_steps, "weeks": week_steps}
+
+
+def time_group(group: str, rows: int, repeat: int) -> list[dict]:
+    """
+    Generates the data of one group and times its steps in this process
+
+    Parameters:
+     group (str): Name from GROUPS, its task folder must be on sys.path
+     rows (int): Number of rows
+     repeat (int): Runs per step
+
+    Returns:
+     results (list[dict]): group, step, rows and seconds of each step
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for step, function in STEPS[group](folder, rows).items():
+            seconds = quiet_best_time(function, repeat)
+            results.append({"group": group, "step": step, "rows": rows, "seconds": seconds})
+            print(f"{group:<13}{step:<25}{rows:>10} rows {seconds * 1000:>12.2f} ms", flush=True)
+    return results
+
+
+def run_benchmarks(sizes: list[int], groups: list[str], repeat: int, max_rows: int = MAX_ROWS) -> list[dict]:
+    """
+    Times every step of the chosen groups, each group and size in its own process
+
+    Parameters:
+     sizes (list[int]): Numbers of rows
+     groups (list[str]): Names from GROUPS
+     repeat (int): Runs per step
+     max_rows (int): Largest size for the groups of IN_MEMORY_GROUPS
+
+    Returns:
+     results (list[dict]): group, step, rows and seconds of each step
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in sizes:
+            for group in groups:
+                if group in IN_MEMORY_GROUPS and rows > max_rows:
+                    print(f"{group:<13}skipped, {rows} rows is more than --max-rows {max_rows}")
+                    continue
+                output = os.path.join(folder, f"{group}-{rows}.json")
+                command = [sys.executable, os.path.abspath(__file__), "--worker", group]
+                command += ["--sizes", str(rows), "--repeat", str(repeat), "--output", output]
+                subprocess.run(command, check=True)
+                with open(output, "r", encoding="utf-8") as f:
+                    results.extend(json.load(f))
+    return results
+
+
+def compare_results(results: list[dict], previous: list[dict], threshold: float) -> list[str]:
+    """
+    Compares the results with the results of a previous run
+
+    Parameters:
+     results (list[dict]): Results of this run
+     previous (list[dict]): Results of the previous run
+     threshold (float): Ratio new / old above which a step is a regression
+
+    Returns:
+     regressions (list[str]): Descriptions of the slower steps
+    """
+    old_times = {(result["group"], result["step"], result["rows"]): result["seconds"] for result in previous}
+    regressions = []
+    for result in results:
+        old = old_times.get((result["group"], result["step"], result["rows"]))
+        if not old:
+            continue
+        ratio = result["seconds"] / old
+        if ratio > threshold:
+            regressions.append(
+                f"{result['group']} {result['step']} ({result['rows']} rows): "
+                f"{old * 1000:.2f} ms -> {result['seconds'] * 1000:.2f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def parse_sizes(text: str) -> list[int]:
+    """Converts a list such as "1e3,1e4,100000" to integers"""
+    return [int(float(size)) for size in text.split(",") if size.strip()]
+
+
+def main():
+    """Runs the benchmarks, saves the results and compares them with a previous run"""
+    parser = argparse.ArgumentParser(description="Time the reservation and energy programs")
+    parser.add_argument("--sizes", type=parse_sizes, default=[1000, 10000, 100000], help="rows, e.g. 1e3,1e4,1e5")
+    parser.add_argument("--groups", default=",".join(GROUPS), help="reservations, energy and/or weeks")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per step, the best time is kept")
+    parser.add_argument("--output", default=None, help="result file (default: benchmark-<time>.json)")
+    parser.add_argument("--compare", default=None, help="previous result file")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown that counts as a regression")
+    parser.add_argument(
+        "--max-rows",
+        type=lambda text: int(float(text)),
+        default=MAX_ROWS,
+        help="largest size for the reservations and energy groups (default: 1e6)",
+    )
+    parser.add_argument("--worker", choices=GROUPS, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        # Started by run_benchmarks(): one group and size, results to --output
+        use_task(args.worker)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(time_group(args.worker, args.sizes[0], max(1, args.repeat)), f)
+        return
+
+    groups = [group.strip() for group in args.groups.split(",") if group.strip()]
+    unknown = [group for group in groups if group not in GROUPS]
+    if unknown:
+        parser.error(f"unknown group: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.sizes, groups, max(1, args.repeat), args.max_rows)
+    output = args.output or f"benchmark-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "numpy": np.__version__ if np is not None else None,
+                "repeat": args.repeat,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+        regressions = compare_results(results, previous, args.threshold)
+        if regressions:
+            print(f"Slower than {args.threshold}x the time in {args.compare}:")
+            for regression in regressions:
+                print(f"- {regression}")
+            sys.exit(1)
+        print(f"No step is slower than {args.threshold}x the time in {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
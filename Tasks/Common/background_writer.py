@@ -0,0 +1,125 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Atomic report files, written in a background thread
+
+The lines are written to a temporary file in the same folder, and only when
+every line has been written and flushed to disk is the temporary file
+renamed over the report file. os.replace() swaps the file in one step, so a
+program reading report.txt sees either the previous report or the new one,
+never a partial file, and a crash in the middle of writing leaves the
+previous report in place.
+
+BackgroundWriter does the writing in one worker thread, so the program is
+not blocked while a large report is written. The
+writes are done in the order they were given, so the last report written
+to a file is the one that stays there.
+"""
+
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+def write_lines_atomically(lines: Iterable[str], filename: str) -> int:
+    """
+    Writes lines to a file through a temporary file
+
+    Parameters:
+     lines (Iterable[str]): Lines without line breaks, can be a generator
+     filename (str): Name of the file to replace
+
+    Returns:
+     count (int): Number of lines written
+    """
+    temporary_file = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    count = 0
+    try:
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            for line in lines:
+                file.write(line + "\n")
+                count += 1
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_file, filename)
+    except BaseException:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+        raise
+    return count
+
+
+class BackgroundWriter:
+    """
+    Writes files with write_lines_atomically() in a worker thread
+
+    with BackgroundWriter() as writer:
+        writer.submit(lines, "report.txt")
+        ...
+        for message in writer.finished():
+            print(message)
+
+    Leaving the with block waits for the writes that are still running.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+        self.pending: list[tuple[str, Future]] = []
+
+    def submit(self, lines: Iterable[str], filename: str) -> Future:
+        """
+        Starts writing lines to a file and returns immediately
+
+        The lines are read in the worker thread, so they must not be
+        changed until the write has finished.
+
+        Returns:
+         (Future): Its result is the number of lines written
+        """
+        future = self.executor.submit(write_lines_atomically, lines, filename)
+        self.pending.append((filename, future))
+        return future
+
+    def busy(self) -> bool:
+        """Returns True if some write has not finished yet"""
+        return any(not future.done() for _, future in self.pending)
+
+    def finished(self) -> list[str]:
+        """
+        Returns a message for each write that has finished since the last call
+
+        Returns:
+         messages (list[str]): e.g. "The report was written to report.txt"
+        """
+        messages = []
+        still_pending = []
+        for filename, future in self.pending:
+            if not future.done():
+                still_pending.append((filename, future))
+                continue
+            error = future.exception()
+            if error is None:
+                messages.append(f"The report was written to {filename}")
+            else:
+                messages.append(f"Could not write {filename}: {error}")
+        self.pending = still_pending
+        return messages
+
+    def close(self) -> list[str]:
+        """Waits for all writes and returns the messages of finished()"""
+        self.executor.shutdown(wait=True)
+        return self.finished()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for message in self.close():
+            print(message)
@@ -0,0 +1,240 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Reads the hourly energy files of Task E and F into NumPy arrays and sums
+them per hour, day, ISO week, month or year with vectorized reductions
+
+2025.csv (Task F):
+Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature
+2025-01-01T00:00:00.000+02:00;1,569;0,000;-4,5
+
+weekNN.csv (Task D and E):
+Time;Consumption phase 1 Wh;...;Production phase 3 Wh
+2025-10-13T00:00:00;462;89;143;0;0;0
+
+The timestamps are local Finnish time, so the date part of the timestamp
+is the day the hour belongs to, also on the days when summer time starts
+or ends. The UTC offset is therefore dropped and the rest is stored as
+datetime64[m].
+
+weekly_summary.py of Task E and energy_loader.py of Task F both use this
+module, energy_loader.py adds the 2025.csv loader on top of it.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by the array loaders
+    np = None
+
+WEEK_COLUMNS = [
+    "consumption_1",
+    "consumption_2",
+    "consumption_3",
+    "production_1",
+    "production_2",
+    "production_3",
+]
+
+# Bucket -> datetime64 unit of its key, weeks are computed from days
+BUCKETS = {"hour": "h", "day": "D", "week": "D", "month": "M", "year": "Y"}
+STATISTICS = ("sum", "mean", "max")
+
+
+def require_numpy() -> None:
+    """Raises an error with instructions if NumPy is not installed"""
+    if np is None:
+        raise ImportError("This function needs NumPy: pip install numpy")
+
+
+def split_fields(filename: str, columns: int) -> list[list[str]]:
+    """
+    Reads a semicolon-separated file and returns its columns as lists of text
+
+    Parameters:
+     filename (str): Name of the CSV file
+     columns (int): Number of columns in the file
+
+    Returns:
+     fields (list[list[str]]): One list per column, header row not included
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)  # Header row
+        text = f.read()
+    lines = text.replace("\r", "").replace(",", ".").split("\n")
+    # A short row followed by a long one would shift every later value,
+    # so the columns are counted on every line
+    for number, line in enumerate(lines, start=2):
+        if line and line.count(";") != columns - 1:
+            raise ValueError(f"{filename}: line {number} must have {columns} columns")
+    lines = [line for line in lines if line]
+    if not lines:
+        return [[] for _ in range(columns)]
+    fields = ";".join(lines).split(";")
+    return [fields[column::columns] for column in range(columns)]
+
+
+def decode_timestamps(characters):
+    """
+    Decodes YYYY-MM-DDTHH:MM timestamps from a byte matrix
+
+    Parameters:
+     characters (np.ndarray): uint8 array with one row of 16 bytes per timestamp
+
+    Returns:
+     (np.ndarray | None): datetime64[m] array, or None if some row is
+     not a valid timestamp in the fixed layout
+    """
+    if len(characters) == 0:
+        return np.array([], dtype="datetime64[m]")
+    if not (characters[:, [4, 7, 10, 13]] == np.frombuffer(b"--T:", dtype=np.uint8)).all():
+        return None
+    digits = characters[:, [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15]].astype(np.int64) - ord("0")
+    if ((digits < 0) | (digits > 9)).any():
+        return None
+
+    def number(start: int, end: int):
+        value = digits[:, start]
+        for position in range(start + 1, end):
+            value = value * 10 + digits[:, position]
+        return value
+
+    month, day, hour, minute = number(4, 6), number(6, 8), number(8, 10), number(10, 12)
+    months = ((number(0, 4) - 1970) * 12 + month - 1).astype("datetime64[M]")
+    days = months.astype("datetime64[D]") + (day - 1)
+    valid = ((month >= 1) & (month <= 12) & (day >= 1) & (hour <= 23) & (minute <= 59)).all()
+    if not valid or not (days.astype("datetime64[M]") == months).all():
+        return None
+    return days.astype("datetime64[m]") + hour * 60 + minute
+
+
+def to_local_minutes(timestamps: list[str]):
+    """
+    Converts ISO timestamps to datetime64[m] local times
+
+    Only the first 16 characters (YYYY-MM-DDTHH:MM) are used, so seconds,
+    milliseconds and the UTC offset are dropped. The digits are read from
+    a fixed-width byte array, which is much faster than letting NumPy parse
+    every timestamp as text.
+
+    Parameters:
+     timestamps (list[str]): Timestamps as text
+
+    Returns:
+     (np.ndarray): datetime64[m] array
+    """
+    raw = np.array(timestamps, dtype="S16")
+    local = decode_timestamps(raw.view(np.uint8).reshape(-1, 16))
+    if local is None:
+        # Let NumPy parse the text, so invalid timestamps raise an error
+        return np.array(timestamps, dtype="U16").astype("datetime64[m]")
+    return local
+
+
+def load_week_arrays(filename: str) -> dict:
+    """
+    Reads a weekNN.csv file into NumPy arrays
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     data (dict): time (datetime64[m]) and the six phase columns in Wh (int64)
+    """
+    require_numpy()
+    fields = split_fields(filename, 7)
+    data = {"time": to_local_minutes(fields[0])}
+    for column, values in zip(WEEK_COLUMNS, fields[1:]):
+        data[column] = np.array(values, dtype=np.int64)
+    return data
+
+
+def bucket_keys(times, bucket: str):
+    """
+    Returns the start of the time bucket of every row
+
+    Parameters:
+     times (np.ndarray): datetime64 local times
+     bucket (str): "hour", "day", "week" (ISO week, from Monday), "month" or "year"
+
+    Returns:
+     (np.ndarray): datetime64 array, e.g. the Monday of the week for "week"
+    """
+    require_numpy()
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket: {bucket}")
+    if bucket == "week":
+        # datetime64[W] weeks start on Thursday like 1970-01-01, ISO weeks on Monday
+        days = times.astype("datetime64[D]")
+        return days - (days.astype(np.int64) + 3) % 7
+    return times.astype(f"datetime64[{BUCKETS[bucket]}]")
+
+
+def group_by(keys, columns: dict, statistics: tuple[str, ...] = ("sum",)) -> dict:
+    """
+    Groups rows by key and computes statistics of each column per group
+
+    The rows of the data files are in time order, so the rows of one group
+    are next to each other. The groups are then found by comparing each key
+    with the previous one and every statistic is a single ufunc.reduceat()
+    over the column, without sorting. Keys out of order are sorted first.
+
+    Parameters:
+     keys (np.ndarray): Group key of every row, e.g. from bucket_keys()
+     columns (dict): Column name -> values of every row
+     statistics (tuple[str, ...]): Any of "sum", "mean" and "max"
+
+    Returns:
+     totals (dict): keys (the groups in ascending order), hours (number of
+     rows per group) and one dictionary per statistic, column -> values per
+     group. Integer columns keep integer sums and maxima.
+    """
+    require_numpy()
+    for statistic in statistics:
+        if statistic not in STATISTICS:
+            raise ValueError(f"Unknown statistic: {statistic}")
+    keys = np.asarray(keys)
+    order = None
+    if len(keys) > 1 and (keys[1:] < keys[:-1]).any():
+        order = keys.argsort(kind="stable")
+        keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if len(keys) else np.zeros(0, np.intp)
+    hours = np.diff(np.append(starts, len(keys)))
+    totals = {"keys": keys[starts], "hours": hours}
+    totals.update((statistic, {}) for statistic in statistics)
+    for column, values in columns.items():
+        values = np.asarray(values) if order is None else np.asarray(values)[order]
+        if not len(starts):
+            sums = maxima = values[:0]
+        else:
+            sums = np.add.reduceat(values, starts) if "sum" in statistics or "mean" in statistics else None
+            maxima = np.maximum.reduceat(values, starts) if "max" in statistics else None
+        if "sum" in statistics:
+            totals["sum"][column] = sums
+        if "mean" in statistics:
+            totals["mean"][column] = sums / hours
+        if "max" in statistics:
+            totals["max"][column] = maxima
+    return totals
+
+
+def aggregate(data: dict, bucket: str, columns: list[str] | None = None, statistics: tuple[str, ...] = ("sum",)) -> dict:
+    """
+    Computes statistics of columns per hour, day, ISO week, month or year
+
+    Parameters:
+     data (dict): Arrays from load_week_arrays() or energy_loader.load_energy_arrays()
+     bucket (str): Key of BUCKETS
+     columns (list[str]): Columns to use, by default all except time
+     statistics (tuple[str, ...]): Any of "sum", "mean" and "max"
+
+    Returns:
+     totals (dict): See group_by(), the keys are the starts of the buckets
+    """
+    columns = columns or [column for column in data if column != "time"]
+    return group_by(bucket_keys(data["time"], bucket), {column: data[column] for column in columns}, statistics)
@@ -0,0 +1,338 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Opt-in stage timing for the report programs
+
+A program marks its stages (reading, conversion, aggregation, writing...)
+with stage() blocks, counted() iterators and timed() functions. When
+instrumentation is off, stage() returns an empty context and counted()
+and timed() return the iterable or function itself, so the program runs as
+before.
+
+Nothing is switched on when the module is imported. The main() of a program
+calls enable_from_args(), which switches instrumentation on if the --stats
+or --profile-stage option of add_arguments() was given, or if an
+environment variable is set:
+
+REPORT_STATS=stats.json python report_engine.py reservations.txt
+REPORT_STATS=- ...                    (summary to stderr)
+REPORT_STATS_PROFILE=convert ...      (cProfile of one stage to stats.json.convert.prof)
+REPORT_STATS_MEMORY=0 ...             (no tracemalloc, the times are then more exact)
+
+For every stage the summary has the wall time spent in the stage itself
+(time in nested stages is not counted twice), the rows it produced and the
+peak of the memory allocated by Python while it was open. The summary is
+written as JSON when the program exits.
+
+best_time() is for the comparisons in the main() of the programs and for
+run_benchmarks.py: it runs a function a few times and keeps the best time.
+
+The module is shared by the programs of Task E, F and G. They add the
+Tasks/Common folder to sys.path before importing it.
+"""
+
+import atexit
+import contextlib
+import cProfile
+import json
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+STATS_VARIABLE = "REPORT_STATS"
+PROFILE_VARIABLE = "REPORT_STATS_PROFILE"
+MEMORY_VARIABLE = "REPORT_STATS_MEMORY"
+
+_END = object()
+
+
+class Stage:
+    """
+    Measurements of one stage
+
+    Parameters:
+     name (str): Name of the stage
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.rows = 0
+        self.calls = 0
+        self.peak_memory = 0
+
+    def summary(self) -> dict:
+        """Returns the measurements as a dictionary"""
+        return {
+            "stage": self.name,
+            "seconds": round(self.seconds, 6),
+            "rows": self.rows,
+            "rows_per_second": round(self.rows / self.seconds) if self.rows and self.seconds else None,
+            "calls": self.calls,
+            "peak_memory_bytes": self.peak_memory,
+        }
+
+
+class Recorder:
+    """
+    Collects the measurements of all stages and writes them at exit
+
+    Parameters:
+     output (str): Summary file, "-" for stderr
+     profile_stage (str | None): Stage to run under cProfile
+     memory (bool): Follow the peak memory with tracemalloc
+    """
+
+    def __init__(self, output: str, profile_stage: str | None = None, memory: bool = True):
+        self.output = output
+        self.profile_stage = profile_stage
+        self.profiler = cProfile.Profile() if profile_stage else None
+        self.stages: dict[str, Stage] = {}
+        self.running: list[list] = []  # [stage, time it was last resumed]
+        self.started = time.perf_counter()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        atexit.register(self.write_summary)
+
+    def get(self, name: str) -> Stage:
+        """Returns the stage with the name, creating it on first use"""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name)
+        return stage
+
+    def _update_memory(self) -> None:
+        """Adds the memory peak since the last call to every running stage"""
+        if tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            for stage, _ in self.running:
+                stage.peak_memory = max(stage.peak_memory, peak)
+            tracemalloc.reset_peak()
+
+    def enter(self, stage: Stage, memory: bool = True) -> None:
+        """Starts timing a stage and pauses the stage around it"""
+        if memory:
+            self._update_memory()
+        now = time.perf_counter()
+        if self.running:
+            outer = self.running[-1]
+            outer[0].seconds += now - outer[1]
+        self.running.append([stage, now])
+        if self.profiler is not None and stage.name == self.profile_stage:
+            self.profiler.enable()
+
+    def exit(self, stage: Stage, memory: bool = True) -> None:
+        """Stops timing a stage and resumes the stage around it"""
+        if self.profiler is not None and stage.name == self.profile_stage:
+            self.profiler.disable()
+        now = time.perf_counter()
+        stage.seconds += now - self.running[-1][1]
+        if memory:
+            self._update_memory()
+        self.running.pop()
+        if self.running:
+            self.running[-1][1] = now
+
+    def count(self, name: str, iterable):
+        """
+        Yields the items of an iterable and times producing them as a stage
+
+        Reading the memory peak for every item would be slow, so the peak of
+        the stage is read when the last item has been produced and covers
+        the whole time the iterable was in use.
+        """
+        stage = self.get(name)
+        stage.calls += 1
+        iterator = iter(iterable)
+        while True:
+            self.enter(stage, memory=False)
+            item = _END
+            try:
+                item = next(iterator, _END)
+            finally:
+                self.exit(stage, memory=item is _END)
+            if item is _END:
+                return
+            stage.rows += 1
+            yield item
+
+    def wrap(self, name: str, function):
+        """Returns a function that times every call of function as a stage"""
+        stage = self.get(name)
+
+        def timed_function(*args, **kwargs):
+            self.enter(stage, memory=False)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.exit(stage, memory=False)
+                stage.rows += 1
+
+        return timed_function
+
+    def summary(self) -> dict:
+        """Returns all measurements as a dictionary"""
+        total = time.perf_counter() - self.started
+        summary = {
+            "command": sys.argv,
+            "total_seconds": round(total, 6),
+            "other_seconds": round(total - sum(stage.seconds for stage in self.stages.values()), 6),
+            "memory_traced": tracemalloc.is_tracing(),
+            "stages": [stage.summary() for stage in self.stages.values()],
+        }
+        if resource is not None:
+            # Kilobytes on Linux
+            summary["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return summary
+
+    def write_summary(self) -> None:
+        """Writes the summary, and the profile of the profiled stage"""
+        summary = self.summary()
+        if self.profiler is not None:
+            base = "report-stats" if self.output == "-" else self.output
+            summary["profile"] = f"{base}.{self.profile_stage}.prof"
+            self.profiler.dump_stats(summary["profile"])
+        if self.output == "-":
+            print(json.dumps(summary, indent=2), file=sys.stderr)
+        else:
+            with open(self.output, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+
+
+class _StageBlock:
+    """Context manager that times one block as a stage"""
+
+    def __init__(self, recorder: Recorder, stage: Stage):
+        self.recorder = recorder
+        self.stage = stage
+
+    def __enter__(self) -> Stage:
+        self.stage.calls += 1
+        self.recorder.enter(self.stage)
+        return self.stage
+
+    def __exit__(self, *exc_info) -> None:
+        self.recorder.exit(self.stage)
+
+
+_recorder: Recorder | None = None
+
+
+def enable(output: str = "-", profile_stage: str | None = None, memory: bool = True) -> Recorder:
+    """
+    Switches instrumentation on, once per program
+
+    Parameters:
+     output (str): Summary file, "-" for stderr
+     profile_stage (str | None): Stage to run under cProfile
+     memory (bool): Follow the peak memory with tracemalloc
+    """
+    global _recorder
+    if _recorder is None:
+        _recorder = Recorder(output, profile_stage, memory)
+    return _recorder
+
+
+def enabled() -> bool:
+    """Returns True if instrumentation is on"""
+    return _recorder is not None
+
+
+def stage(name: str):
+    """
+    Times a block as a stage:
+
+    with stage("write") as measured:
+        ...
+        measured.rows = len(lines)
+    """
+    if _recorder is None:
+        # A new stage every time, so the rows set by one caller are not seen by others
+        return contextlib.nullcontext(Stage(name))
+    return _StageBlock(_recorder, _recorder.get(name))
+
+
+def counted(name: str, iterable):
+    """
+    Times producing the items of an iterable as a stage and counts them
+
+    Returns the iterable itself when instrumentation is off.
+    """
+    if _recorder is None:
+        return iterable
+    return _recorder.count(name, iterable)
+
+
+def timed(name: str, function):
+    """
+    Times every call of a function as a stage, one row per call
+
+    Returns the function itself when instrumentation is off. The memory peak
+    is not read per call, it is included in the stages around the calls.
+    """
+    if _recorder is None:
+        return function
+    return _recorder.wrap(name, function)
+
+
+def add_arguments(parser) -> None:
+    """Adds the --stats and --profile-stage options to an ArgumentParser"""
+    parser.add_argument("--stats", default=None, help="write stage timings as JSON to a file (- for stderr)")
+    parser.add_argument("--profile-stage", default=None, help="run one stage under cProfile")
+
+
+def enable_from_args(args) -> None:
+    """
+    Switches instrumentation on if --stats or --profile-stage was given,
+    otherwise if REPORT_STATS is set
+    """
+    if args.stats or args.profile_stage:
+        enable(args.stats or "-", args.profile_stage, os.environ.get(MEMORY_VARIABLE, "1") != "0")
+    else:
+        enable_from_environment()
+
+
+def enable_from_environment() -> None:
+    """
+    Switches instrumentation on if REPORT_STATS is set
+
+    Worker processes inherit the variable, but only the main
+    process writes the summary.
+    """
+    output = os.environ.get(STATS_VARIABLE)
+    if output and multiprocessing.parent_process() is None:
+        enable(output, os.environ.get(PROFILE_VARIABLE) or None, os.environ.get(MEMORY_VARIABLE, "1") != "0")
+
+
+def best_time(function, *arguments, repeat: int = 3) -> tuple[object, float]:
+    """
+    Runs a function repeat times and keeps the shortest run time
+
+    Parameters:
+     function (Callable): Function to time
+     arguments: Arguments of the function
+     repeat (int): Number of runs
+
+    Returns:
+     result, seconds (tuple): Result of the last run and the best time in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*arguments)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
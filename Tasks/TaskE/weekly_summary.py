@@ -0,0 +1,242 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Writes the weekly electricity summary (Task E) for any number of week files
+
+Instead of the fixed week41.csv, week42.csv and week43.csv, the program takes
+folders or glob patterns and finds every weekNN.csv in them. The files are
+read and summed per day and per phase in a process pool, one file per task,
+and the weekly tables are written to summary.txt in date order.
+
+python weekly_summary.py [folder or pattern ...] [--workers 4] [--output summary.txt]
+                         [--stats stats.json] [--profile-stage summarize]
+
+With --stats (or REPORT_STATS=stats.json) the time, rows and peak memory of
+the find, summarize, format and write stages are saved, see
+instrumentation.py. Work done in the worker processes is timed as part of
+summarize.
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from background_writer import write_lines_atomically  # noqa: E402
+from energy_arrays import WEEK_COLUMNS, aggregate, load_week_arrays, np  # noqa: E402
+from instrumentation import add_arguments, enable_from_args, stage  # noqa: E402
+
+WEEK_FILE = re.compile(r"week(\d+)\.csv$")
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+LINE = "---------------------------------------------------------------------------"
+
+
+def find_week_files(paths: list[str]) -> list[str]:
+    """
+    Finds the weekNN.csv files in folders or glob patterns
+
+    Parameters:
+     paths (list[str]): Folders, files or glob patterns
+
+    Returns:
+     files (list[str]): Matching files without duplicates
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            path = os.path.join(path, "week*.csv")
+        for filename in sorted(glob.glob(path)):
+            if WEEK_FILE.search(os.path.basename(filename)) and filename not in files:
+                files.append(filename)
+    return files
+
+
+def sum_days(filename: str) -> list[tuple[date, list[int]]]:
+    """
+    Sums the hourly Wh values of a week file per day and per phase
+
+    With NumPy the file is read into arrays and summed with aggregate() of
+    energy_arrays.py, the same code that sums the Task F data.
+    Without NumPy the rows are added up one at a time.
+
+    Parameters:
+     filename (str): Name of the week file
+
+    Returns:
+     days (list): (date, [consumption v1-v3, production v1-v3] in Wh) in date order
+    """
+    if np is not None:
+        totals = aggregate(load_week_arrays(filename), "day", WEEK_COLUMNS)
+        phases = np.column_stack([totals["sum"][column] for column in WEEK_COLUMNS]).tolist()
+        return list(zip(totals["keys"].astype(date).tolist(), phases))
+
+    days: dict[date, list[int]] = {}
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)  # Header row
+        for line in f:
+            if len(line) > 1:
+                fields = line.strip().split(";")
+                day = datetime.fromisoformat(fields[0]).date()
+                totals = days.setdefault(day, [0, 0, 0, 0, 0, 0])
+                for phase in range(6):
+                    totals[phase] += int(fields[phase + 1])
+    return sorted(days.items())
+
+
+def summarize_week(filename: str) -> dict:
+    """
+    Sums the hourly Wh values of one week file per day and per phase
+
+    Parameters:
+     filename (str): Name of the week file
+
+    Returns:
+     summary (dict): week (int), file (str) and days, a list of
+     (date, [consumption v1-v3, production v1-v3] in Wh) in date order
+    """
+    days = sum_days(filename)
+    match = WEEK_FILE.search(os.path.basename(filename))
+    return {
+        "week": int(match.group(1)) if match else days[0][0].isocalendar()[1],
+        "file": filename,
+        "days": days,
+    }
+
+
+def summarize_weeks(files: list[str], workers: int | None = None) -> list[dict]:
+    """
+    Summarizes week files in parallel and returns them in date order
+
+    Parameters:
+     files (list[str]): Week files
+     workers (int): Number of processes, by default the number of CPUs
+
+    Returns:
+     summaries (list[dict]): Results of summarize_week(), earliest week first
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(files) < 2:
+        summaries = [summarize_week(filename) for filename in files]
+    else:
+        with ProcessPoolExecutor(min(workers, len(files))) as executor:
+            summaries = list(executor.map(summarize_week, files))
+    # Week numbers start again every year, so sort by the first day
+    summaries = [summary for summary in summaries if summary["days"]]
+    return sorted(summaries, key=lambda summary: (summary["days"][0][0], summary["week"]))
+
+
+def format_kwh(wh: int) -> str:
+    """Converts Wh to kWh with two decimals and a decimal comma"""
+    return f"{wh / 1000:.2f}".replace(".", ",")
+
+
+def format_week(summary: dict) -> list[str]:
+    """
+    Formats the table of one week
+
+    Parameters:
+     summary (dict): Result of summarize_week()
+
+    Returns:
+     lines (list[str]): Report lines
+    """
+    lines = [
+        f"Week {summary['week']} electricity consumption and production (kWh, by phase)",
+        f"{'Day':<11}{'Date':<15}{'Consumption [kWh]':<29}Production [kWh]",
+        f"{'':<26}{'v1':<8}{'v2':<8}{'v3':<13}{'v1':<8}{'v2':<8}v3",
+        LINE,
+    ]
+    for day, totals in summary["days"]:
+        values = [format_kwh(value) for value in totals]
+        lines.append(
+            f"{WEEKDAYS[day.weekday()]:<11}{day.strftime('%d.%m.%Y'):<15}"
+            f"{values[0]:<8}{values[1]:<8}{values[2]:<13}{values[3]:<8}{values[4]:<8}{values[5]}"
+        )
+    lines.append("")
+    return lines
+
+
+def format_total(summaries: list[dict]) -> list[str]:
+    """
+    Formats the combined totals of all weeks
+
+    Parameters:
+     summaries (list[dict]): Results of summarize_week()
+    """
+    consumption = sum(sum(totals[:3]) for summary in summaries for _, totals in summary["days"])
+    production = sum(sum(totals[3:]) for summary in summaries for _, totals in summary["days"])
+    return [
+        f"All weeks ({len(summaries)}) combined",
+        f"- Total consumption: {format_kwh(consumption)} kWh",
+        f"- Total production: {format_kwh(production)} kWh",
+    ]
+
+
+def build_summary(summaries: list[dict]) -> list[str]:
+    """
+    Formats the whole report
+
+    Parameters:
+     summaries (list[dict]): Results of summarize_week() in date order
+    """
+    lines = []
+    for summary in summaries:
+        lines.extend(format_week(summary))
+    return lines + format_total(summaries)
+
+
+def write_summary(lines: list[str], filename: str = "summary.txt") -> None:
+    """
+    Writes the report lines to a file through a temporary file, so an
+    interrupted run leaves the previous summary.txt in place
+
+    Parameters:
+     lines (list[str]): Report lines
+     filename (str): Name of the report file
+    """
+    write_lines_atomically(lines, filename)
+
+
+def main() -> None:
+    """Finds the week files, summarizes them and writes summary.txt"""
+    parser = argparse.ArgumentParser(description="Write the weekly electricity summary")
+    parser.add_argument("paths", nargs="*", default=["."], help="folders, files or glob patterns of weekNN.csv files")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPUs)")
+    parser.add_argument("--output", default="summary.txt", help="report file (default: summary.txt)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(args)
+
+    with stage("find") as measured:
+        files = find_week_files(args.paths)
+        measured.rows = len(files)
+    if not files:
+        print("No weekNN.csv files found.")
+        return
+    with stage("summarize") as measured:
+        summaries = summarize_weeks(files, args.workers)
+        measured.rows = sum(len(summary["days"]) for summary in summaries)
+    with stage("format") as measured:
+        lines = build_summary(summaries)
+        measured.rows = len(lines)
+    with stage("write") as measured:
+        write_summary(lines, args.output)
+        measured.rows = len(lines)
+    print(f"{len(summaries)} weeks written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Prefix-sum index for answering date-range questions about the hourly data
+without going through the rows again
+
+For every column the index keeps the running total up to each row:
+
+cumulative[i] = value[0] + value[1] + ... + value[i - 1]
+
+The total of rows lo..hi-1 is then cumulative[hi] - cumulative[lo], and the
+positions lo and hi of a date range are found with a binary search over the
+sorted local timestamps. The index is built once in O(n) and every range
+total or average after that costs O(log n), independent of the range length.
+Searching by local time (rather than counting hours from the start) keeps
+the repeated and skipped hours of the summer-time changes in the right day.
+
+python energy_index.py [2025.csv] checks that ranges reaching past the data,
+up to 31.12.9999, give the totals of the data.
+"""
+
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+
+from energy_loader import ENERGY_COLUMNS, read_data
+
+
+class RangeTotals:
+    """
+    Totals of one date range
+
+    Parameters:
+     hours (int): Number of hourly rows in the range
+     sums (dict[str, float]): Sum of each column in the range
+    """
+
+    def __init__(self, hours: int, sums: dict[str, float]):
+        self.hours = hours
+        self.sums = sums
+
+    def total(self, column: str) -> float:
+        """Returns the sum of a column"""
+        return self.sums[column]
+
+    def average(self, column: str) -> float:
+        """Returns the average of a column per hourly row, 0 for an empty range"""
+        return self.sums[column] / self.hours if self.hours else 0.0
+
+
+class EnergyIndex:
+    """
+    Prefix sums over hourly rows sorted by local time
+
+    Parameters:
+     times (list[datetime]): Local time of each row, in ascending order
+     columns (dict[str, list[float]]): Values of each column, same order as times.
+      An optional "hours" column gives the number of hours each row stands for.
+    """
+
+    def __init__(self, times: list[datetime], columns: dict[str, list[float]]):
+        self.times = times
+        self.cumulative = {
+            column: list(accumulate(values, initial=0.0)) for column, values in columns.items()
+        }
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "EnergyIndex":
+        """
+        Builds the index from the rows of energy_loader.read_data()
+
+        Parameters:
+         rows (list[tuple]): (local time, consumption, production, temperature)
+        """
+        rows = sorted(rows, key=lambda row: row[0])
+        columns = {column: [row[position + 1] for row in rows] for position, column in enumerate(ENERGY_COLUMNS)}
+        return cls([row[0] for row in rows], columns)
+
+    @classmethod
+    def from_arrays(cls, data: dict) -> "EnergyIndex":
+        """
+        Builds the index from the arrays of energy_loader.load_energy_arrays()
+
+        Parameters:
+         data (dict): time and value arrays
+        """
+        order = data["time"].argsort(kind="stable")
+        times = data["time"][order].astype(datetime).tolist()
+        columns = {column: data[column][order].tolist() for column in data if column != "time"}
+        return cls(times, columns)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def first_day(self) -> date:
+        """Returns the date of the first row"""
+        return self.times[0].date()
+
+    def last_day(self) -> date:
+        """Returns the date of the last row"""
+        return self.times[-1].date()
+
+    def position(self, day: date) -> int:
+        """
+        Returns the position of the first row on or after the start of a day
+
+        Parameters:
+         day (date): Day
+        """
+        return bisect_left(self.times, datetime(day.year, day.month, day.day))
+
+    def range_totals(self, start: date, end: date) -> RangeTotals:
+        """
+        Returns the totals from the start of start to the end of end
+
+        Parameters:
+         start (date): First day
+         end (date): Last day (included)
+        """
+        lo = self.position(start)
+        # The last moment of the end day, end + 1 day would overflow on 31.12.9999
+        hi = bisect_right(self.times, datetime.combine(end, time.max))
+        if hi < lo:
+            hi = lo
+        sums = {column: values[hi] - values[lo] for column, values in self.cumulative.items()}
+        # Rows of a rollup index are days, and they carry their hour count
+        hours = round(sums.pop("hours")) if "hours" in sums else hi - lo
+        return RangeTotals(hours, sums)
+
+    def month_totals(self, year: int, month: int) -> RangeTotals:
+        """
+        Returns the totals of one month
+
+        Parameters:
+         year (int): Year
+         month (int): Month 1-12
+        """
+        start = date(year, month, 1)
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        return self.range_totals(start, next_month - timedelta(days=1))
+
+    def year_totals(self, year: int) -> RangeTotals:
+        """
+        Returns the totals of one year
+
+        Parameters:
+         year (int): Year
+        """
+        return self.range_totals(date(year, 1, 1), date(year, 12, 31))
+
+
+def check_ranges(index: EnergyIndex) -> None:
+    """Checks that ranges reaching past the data give the totals of the data"""
+    whole = index.range_totals(index.first_day(), index.last_day())
+    for start, end in (
+        (date.min, date.max),
+        (index.first_day(), date(9999, 12, 31)),
+        (index.first_day() - timedelta(days=400), index.last_day() + timedelta(days=400)),
+    ):
+        totals = index.range_totals(start, end)
+        if totals.hours != whole.hours or totals.sums != whole.sums:
+            raise AssertionError(f"{start}–{end} should give the totals of the whole data")
+    if index.range_totals(date.max, date.max).hours or index.range_totals(date.min, date.min).hours:
+        raise AssertionError("a range outside the data should be empty")
+
+
+def main():
+    """Builds the index of a CSV file and checks the range totals"""
+    filename = sys.argv[1] if len(sys.argv) > 1 else "2025.csv"
+    index = EnergyIndex.from_rows(read_data(filename))
+    check_ranges(index)
+    print(f"{len(index)} rows from {index.first_day()} to {index.last_day()}, range checks passed")
+
+
+if __name__ == "__main__":
+    main()
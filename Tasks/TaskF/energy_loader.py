@@ -0,0 +1,221 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Reads 2025.csv into NumPy arrays and computes daily, monthly and yearly
+summaries with vectorized reductions
+
+2025.csv:
+Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature
+2025-01-01T00:00:00.000+02:00;1,569;0,000;-4,5
+
+The parsing and grouping code is shared with Task E and lives in
+../Common/energy_arrays.py. It is imported here, so the other Task F
+modules can still import all of it from energy_loader.
+
+read_data() is the plain Python loop (one row at a time, float(x.replace(",", ".")))
+and is kept for comparison:
+
+python energy_loader.py [2025.csv] [years]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from energy_arrays import (  # noqa: E402, F401
+    BUCKETS,
+    STATISTICS,
+    WEEK_COLUMNS,
+    aggregate,
+    bucket_keys,
+    decode_timestamps,
+    group_by,
+    load_week_arrays,
+    np,
+    require_numpy,
+    split_fields,
+    to_local_minutes,
+)
+
+ENERGY_COLUMNS = ["consumption", "production", "temperature"]
+UNIT_BUCKETS = {"D": "day", "M": "month", "Y": "year"}
+
+
+def read_data(filename: str) -> list[tuple[datetime, float, float, float]]:
+    """
+    Reads 2025.csv one row at a time with plain Python
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     rows (list[tuple]): (local time, consumption kWh, production kWh, temperature °C)
+    """
+    rows = []
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)  # Header row
+        for line in f:
+            if len(line) > 1:
+                fields = line.strip().split(";")
+                rows.append(
+                    (
+                        datetime.fromisoformat(fields[0][:19]),
+                        float(fields[1].replace(",", ".")),
+                        float(fields[2].replace(",", ".")),
+                        float(fields[3].replace(",", ".")),
+                    )
+                )
+    return rows
+
+
+def load_energy_arrays(filename: str) -> dict:
+    """
+    Reads 2025.csv into NumPy arrays
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     data (dict): time (datetime64[m]), consumption, production
+     and temperature (float64)
+    """
+    require_numpy()
+    fields = split_fields(filename, 4)
+    data = {"time": to_local_minutes(fields[0])}
+    for column, values in zip(ENERGY_COLUMNS, fields[1:]):
+        data[column] = np.array(values, dtype=np.float64)
+    return data
+
+
+def group_totals(data: dict, unit: str, columns: list[str] | None = None) -> dict:
+    """
+    Sums columns by day, month or year
+
+    Parameters:
+     data (dict): Arrays from load_energy_arrays() or load_week_arrays()
+     unit (str): "D" for days, "M" for months or "Y" for years
+     columns (list[str]): Columns to sum, by default all except time
+
+    Returns:
+     totals (dict): keys (datetime64 array of the groups), hours (number of
+     rows per group) and the sum of each column per group
+    """
+    totals = aggregate(data, UNIT_BUCKETS[unit], columns)
+    return {"keys": totals["keys"], "hours": totals["hours"], **totals["sum"]}
+
+
+def daily_summary(data: dict) -> dict:
+    """Returns the totals of each day, see group_totals()"""
+    return group_totals(data, "D")
+
+
+def monthly_summary(data: dict) -> dict:
+    """Returns the totals of each month, see group_totals()"""
+    return group_totals(data, "M")
+
+
+def yearly_summary(data: dict) -> dict:
+    """Returns the totals of each year, see group_totals()"""
+    return group_totals(data, "Y")
+
+
+def python_summary(rows: list[tuple], unit: str) -> dict:
+    """
+    The same sums as group_totals() computed with a plain Python loop
+
+    Parameters:
+     rows (list[tuple]): Rows from read_data()
+     unit (str): "D" for days, "M" for months or "Y" for years
+
+    Returns:
+     totals (dict): Group key -> [hours, consumption, production, temperature sum]
+    """
+    totals = {}
+    for moment, consumption, production, temperature in rows:
+        if unit == "D":
+            key = moment.date()
+        elif unit == "M":
+            key = date(moment.year, moment.month, 1)
+        else:
+            key = date(moment.year, 1, 1)
+        total = totals.setdefault(key, [0, 0.0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += consumption
+        total[2] += production
+        total[3] += temperature
+    return totals
+
+
+def write_years(source_file: str, target_file: str, years: int) -> None:
+    """
+    Writes a larger file by repeating the rows of one year with later years
+
+    Parameters:
+     source_file (str): File with one year of data, e.g. 2025.csv
+     target_file (str): File to create
+     years (int): Number of years to write
+    """
+    with open(source_file, "r", encoding="utf-8") as f:
+        header = f.readline()
+        lines = [line.strip() for line in f if len(line) > 1]
+    with open(target_file, "w", encoding="utf-8") as f:
+        f.write(header)
+        for year in range(years):
+            for line in lines:
+                f.write(f"{int(line[:4]) + year}{line[4:]}\n")
+
+
+def main():
+    """
+    Compares the plain Python loop and the NumPy version and prints
+    the yearly summary
+    """
+    require_numpy()
+    source_file = sys.argv[1] if len(sys.argv) > 1 else "2025.csv"
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with tempfile.TemporaryDirectory() as folder:
+        filename = f"{folder}/energy.csv"
+        write_years(source_file, filename, years)
+
+        started = time.perf_counter()
+        rows = read_data(filename)
+        python_monthly = python_summary(rows, "M")
+        python_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        data = load_energy_arrays(filename)
+        monthly = monthly_summary(data)
+        numpy_time = time.perf_counter() - started
+
+    for position, key in enumerate(monthly["keys"].astype(date)):
+        expected = python_monthly[key]
+        if expected[0] != monthly["hours"][position] or abs(expected[1] - monthly["consumption"][position]) > 1e-6:
+            raise AssertionError(f"NumPy and Python summaries differ for {key}")
+
+    yearly = yearly_summary(data)
+    print(f"Rows: {len(rows)}")
+    print(f"- plain Python: {python_time:.2f} s")
+    print(f"- NumPy: {numpy_time:.2f} s")
+    print(f"- speedup: {python_time / numpy_time:.1f}x")
+    for position, key in enumerate(yearly["keys"].astype(date)):
+        hours = yearly["hours"][position]
+        print(
+            f"{key.year}: consumption {yearly['consumption'][position]:.2f} kWh, "
+            f"production {yearly['production'][position]:.2f} kWh, "
+            f"average temperature {yearly['temperature'][position] / hours:.2f} °C".replace(".", ",")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Interactive report generator for the annual energy data (Task F)
+
+The hourly data is rolled up per day and per month once and the rollups are
+saved next to the CSV file (see energy_rollup.py). Each report is answered
+from prefix sums over the days instead of going through all hourly rows, and
+the latest reports are remembered in case the same report is asked again:
+
+Choose a report type:
+1) Daily summary for a date range
+2) Monthly summary for one month
+3) Full year summary
+4) Exit the program
+
+python energy_reports.py [2025.csv]
+
+REPORT_STATS=stats.json saves the time, rows and peak memory of the load,
+report, print and write stages, see instrumentation.py.
+
+report.txt is written in a background thread through a temporary file, so
+a new report can be chosen while it is written and report.txt never
+contains half a report (see background_writer.py).
+"""
+
+import os
+import sys
+import threading
+from datetime import date, datetime
+from functools import lru_cache
+
+from energy_index import EnergyIndex, RangeTotals
+from energy_rollup import load_rollup_index, source_key
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from background_writer import BackgroundWriter, write_lines_atomically  # noqa: E402
+from instrumentation import enable_from_environment, stage  # noqa: E402
+
+MONTH_NAMES = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+SEPARATOR = "-----------------------------------------------------"
+
+REPORT_CACHE_SIZE = 128
+
+
+def format_number(value: float) -> str:
+    """Formats a number with two decimals and a decimal comma"""
+    return f"{value:.2f}".replace(".", ",")
+
+
+def format_day(day: date) -> str:
+    """Formats a date as d.m.yyyy"""
+    return f"{day.day}.{day.month}.{day.year}"
+
+
+def parse_day(text: str) -> date:
+    """
+    Converts a date in the format dd.mm.yyyy to a date object
+
+    Parameters:
+     text (str): Date as text, e.g. 1.11.2025
+    """
+    return datetime.strptime(text.strip(), "%d.%m.%Y").date()
+
+
+def totals_lines(totals: RangeTotals) -> list[str]:
+    """
+    Returns the total and average lines shared by all reports
+
+    Parameters:
+     totals (RangeTotals): Totals of the report period
+    """
+    return [
+        f"- Total consumption: {format_number(totals.total('consumption'))} kWh",
+        f"- Total production: {format_number(totals.total('production'))} kWh",
+        f"- Average temperature: {format_number(totals.average('temperature'))} °C",
+    ]
+
+
+def create_daily_report(index: EnergyIndex, start: date, end: date) -> list[str]:
+    """
+    Builds the report for a date range
+
+    Parameters:
+     index (EnergyIndex): Indexed data
+     start (date): First day
+     end (date): Last day (included)
+
+    Returns:
+     lines (list[str]): Report lines
+    """
+    lines = [SEPARATOR, f"Report for the period {format_day(start)}–{format_day(end)}"]
+    return lines + totals_lines(index.range_totals(start, end))
+
+
+def create_monthly_report(index: EnergyIndex, month: int, year: int) -> list[str]:
+    """
+    Builds the report for one month
+
+    Parameters:
+     index (EnergyIndex): Indexed data
+     month (int): Month 1-12
+     year (int): Year
+
+    Returns:
+     lines (list[str]): Report lines
+    """
+    lines = [SEPARATOR, f"Report for the month: {MONTH_NAMES[month - 1]}"]
+    return lines + totals_lines(index.month_totals(year, month))
+
+
+def create_yearly_report(index: EnergyIndex, year: int) -> list[str]:
+    """
+    Builds the report for one year
+
+    Parameters:
+     index (EnergyIndex): Indexed data
+     year (int): Year
+
+    Returns:
+     lines (list[str]): Report lines
+    """
+    lines = [SEPARATOR, f"Report for the year: {year}"]
+    return lines + totals_lines(index.year_totals(year))
+
+
+class ReportCache:
+    """
+    Builds the reports of a data file and remembers the latest ones
+
+    At most maxsize reports are kept in an LRU cache. The key is the report
+    type and the parsed parameters, so 1.3.2025 and 01.03.2025 give the same
+    report. The file is checked before every report, and if its size or
+    modification time has changed, the data is loaded again and the cache
+    is emptied.
+
+    Parameters:
+     filename (str): Name of the CSV file
+     maxsize (int): Number of reports to remember
+    """
+
+    def __init__(self, filename: str, maxsize: int = REPORT_CACHE_SIZE):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.source: tuple | None = None
+        self.index: EnergyIndex | None = None
+        self.build = lru_cache(maxsize=maxsize)(self._build)
+        self.load()
+
+    def load(self) -> tuple[tuple, EnergyIndex]:
+        """
+        Returns the indexed data, loading it again if the file has changed
+
+        The source key and the index are read under the same lock, so a
+        report built from the index is always cached under its own key even
+        if another thread loads the file again.
+
+        Returns:
+         (tuple[tuple, EnergyIndex]): Source key of the file and its index
+        """
+        source = tuple(source_key(self.filename))
+        with self.lock:
+            if source != self.source:
+                self.index = load_rollup_index(self.filename)
+                self.source = source
+                self.build.cache_clear()
+            return self.source, self.index
+
+    def _build(self, source: tuple, index: EnergyIndex, report_type: str, parameters: tuple) -> tuple[str, ...]:
+        """Builds a report from the index loaded for the source"""
+        builders = {
+            "daily": create_daily_report,
+            "monthly": create_monthly_report,
+            "yearly": create_yearly_report,
+        }
+        return tuple(builders[report_type](index, *parameters))
+
+    def report(self, report_type: str, *parameters) -> list[str]:
+        """
+        Returns a report from the cache or builds it
+
+        Parameters:
+         report_type (str): "daily", "monthly" or "yearly"
+         parameters: Parameters of create_daily_report(), create_monthly_report()
+          or create_yearly_report() after the index
+        """
+        source, index = self.load()
+        return list(self.build(source, index, report_type, parameters))
+
+    def daily_report(self, start: date, end: date) -> list[str]:
+        """Returns the report for a date range, see create_daily_report()"""
+        return self.report("daily", start, end)
+
+    def monthly_report(self, month: int, year: int) -> list[str]:
+        """Returns the report for one month, see create_monthly_report()"""
+        return self.report("monthly", month, year)
+
+    def yearly_report(self, year: int) -> list[str]:
+        """Returns the report for one year, see create_yearly_report()"""
+        return self.report("yearly", year)
+
+    def cache_info(self):
+        """Returns the hits, misses, maxsize and currsize of the cache"""
+        return self.build.cache_info()
+
+
+def print_report_to_console(lines: list[str]) -> None:
+    """Prints report lines to the console"""
+    for line in lines:
+        print(line)
+
+
+def write_report_to_file(lines: list[str], filename: str = "report.txt") -> None:
+    """
+    Writes report lines to a file, replacing the previous report in one
+    step, see background_writer.py
+
+    Parameters:
+     lines (list[str]): Report lines
+     filename (str): Name of the report file
+    """
+    write_lines_atomically(lines, filename)
+
+
+def show_main_menu(year: int) -> str:
+    """Prints the main menu and returns the user selection"""
+    print("Choose a report type:")
+    print("1) Daily summary for a date range")
+    print("2) Monthly summary for one month")
+    print(f"3) Full year {year} summary")
+    print("4) Exit the program")
+    return input("Your choice: ").strip()
+
+
+def show_next_menu() -> str:
+    """Prints the menu shown after a report and returns the user selection"""
+    print("What would you like to do next?")
+    print("1) Write the report to the file report.txt")
+    print("2) Create a new report")
+    print("3) Exit")
+    return input("Your choice: ").strip()
+
+
+def ask_report(reports: ReportCache, choice: str, year: int) -> list[str] | None:
+    """
+    Asks the inputs of the chosen report and builds it
+
+    Parameters:
+     reports (ReportCache): Reports of the data file
+     choice (str): Main menu selection 1-3
+     year (int): Year of the monthly and yearly reports
+
+    Returns:
+     lines (list[str] | None): Report lines, or None if the input was invalid
+    """
+    try:
+        match choice:
+            case "1":
+                start = parse_day(input("Enter start date (dd.mm.yyyy): "))
+                end = parse_day(input("Enter end date (dd.mm.yyyy): "))
+                if end < start:
+                    print("The end date must not be before the start date.")
+                    return None
+                with stage("report"):
+                    return reports.daily_report(start, end)
+            case "2":
+                month = int(input("Enter month number (1–12): "))
+                if not 1 <= month <= 12:
+                    print("The month number must be between 1 and 12.")
+                    return None
+                with stage("report"):
+                    return reports.monthly_report(month, year)
+            case "3":
+                with stage("report"):
+                    return reports.yearly_report(year)
+    except ValueError:
+        print("Invalid input. Please, try again.")
+    except OSError as e:
+        print(f"Could not read the data file: {e}")
+    return None
+
+
+def main() -> None:
+    """Reads the data, shows the menus and controls report generation"""
+    filename = sys.argv[1] if len(sys.argv) > 1 else "2025.csv"
+    enable_from_environment()
+    with stage("load") as measured:
+        reports = ReportCache(filename)
+        measured.rows = len(reports.index)
+    year = reports.index.first_day().year
+    # The report file is written in the background while the menu is used
+    with BackgroundWriter() as writer:
+        try:
+            while True:
+                for message in writer.finished():
+                    print(message)
+                choice = show_main_menu(year)
+                if choice == "4":
+                    print("Thank you! Bye!")
+                    break
+                if choice not in ("1", "2", "3"):
+                    print("Unknown choice. Please, do a new selection.")
+                    continue
+                lines = ask_report(reports, choice, year)
+                if lines is None:
+                    continue
+                with stage("print") as measured:
+                    print_report_to_console(lines)
+                    measured.rows += len(lines)
+                next_choice = show_next_menu()
+                if next_choice == "1":
+                    # Only starting the write is timed, the menu does not wait for it
+                    with stage("write") as measured:
+                        writer.submit(lines, "report.txt")
+                        measured.rows += len(lines)
+                    print("Writing the report to report.txt")
+                elif next_choice == "3":
+                    print("Thank you! Bye!")
+                    break
+        except KeyboardInterrupt:
+            print("\nYou pressed CTRL-C")
+
+
+if __name__ == "__main__":
+    main()
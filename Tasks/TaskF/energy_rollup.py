@@ -0,0 +1,243 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Daily and monthly rollups of the hourly energy data, saved next to the CSV
+
+The reports only ever need whole days, so the hourly rows are summed per day
+and per month once (hours, consumption, production and temperature sum) and
+saved to 2025.csv.rollup.json. The rollup file remembers the path, size and
+modification time of the CSV file. As long as they match, the reports are
+built from the rollups and the hourly data is not read at all. If the CSV
+file changes, the rollups are built again.
+
+python energy_rollup.py [2025.csv]
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+
+from energy_index import EnergyIndex, RangeTotals
+from energy_loader import ENERGY_COLUMNS, np, python_summary, read_data
+from energy_timestamps import key_totals, load_zoned_arrays
+
+ROLLUP_VERSION = 1
+
+
+def rollup_file_for(filename: str) -> str:
+    """Returns the name of the rollup file of a CSV file"""
+    return filename + ".rollup.json"
+
+
+def source_key(filename: str) -> list:
+    """
+    Returns what identifies one version of a CSV file
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     (list): Absolute path, size in bytes and modification time in ns
+    """
+    stat = os.stat(filename)
+    return [os.path.abspath(filename), stat.st_size, stat.st_mtime_ns]
+
+
+def build_rollups(rows: list[tuple]) -> dict:
+    """
+    Sums the hourly rows per day and per month
+
+    Parameters:
+     rows (list[tuple]): Rows from energy_loader.read_data()
+
+    Returns:
+     rollups (dict): "daily" and "monthly" lists of
+     [ISO date, hours, consumption, production, temperature sum]
+    """
+    rollups = {}
+    for name, unit in (("daily", "D"), ("monthly", "M")):
+        totals = python_summary(rows, unit)
+        rollups[name] = [[key.isoformat(), *totals[key]] for key in sorted(totals)]
+    return rollups
+
+
+def read_rollups(filename: str) -> dict:
+    """
+    Reads a CSV file and builds its rollups, with the vectorized timestamp
+    decoder of energy_timestamps.py when NumPy is installed
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     rollups (dict): See build_rollups()
+    """
+    if np is None:
+        return build_rollups(read_data(filename))
+    data = load_zoned_arrays(filename)
+    rollups = {}
+    for name, key in (("daily", "day"), ("monthly", "month")):
+        totals = key_totals(data, key)
+        rollups[name] = [[day.isoformat(), *totals[day]] for day in sorted(totals)]
+    return rollups
+
+
+def valid_rollup_rows(rows) -> bool:
+    """
+    Tells if a section of a rollup file is a list of
+    [ISO date, hours, consumption, production, temperature sum] rows
+    """
+    if not isinstance(rows, list):
+        return False
+    for row in rows:
+        if not isinstance(row, list) or len(row) != len(ENERGY_COLUMNS) + 2 or not isinstance(row[0], str):
+            return False
+        if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in row[1:]):
+            return False
+        try:
+            date.fromisoformat(row[0])
+        except ValueError:
+            return False
+    return True
+
+
+def load_rollup_cache(rollup_file: str, key: list) -> dict | None:
+    """
+    Loads rollups from a rollup file
+
+    Returns:
+     rollups (dict | None): Rollups, or None if the file is missing, damaged,
+     lacks the daily or monthly rollups or belongs to another version of the
+     CSV file
+    """
+    try:
+        with open(rollup_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != ROLLUP_VERSION or cached.get("source") != key:
+        return None
+    if not valid_rollup_rows(cached.get("daily")) or not valid_rollup_rows(cached.get("monthly")):
+        return None
+    return cached
+
+
+def save_rollup_cache(rollup_file: str, key: list, rollups: dict) -> None:
+    """
+    Saves rollups to a rollup file through a temporary file
+
+    Parameters:
+     rollup_file (str): Name of the rollup file
+     key (list): source_key() of the CSV file
+     rollups (dict): Rollups from build_rollups()
+    """
+    temporary_file = f"{rollup_file}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file, "w", encoding="utf-8") as f:
+            json.dump({"version": ROLLUP_VERSION, "source": key, **rollups}, f)
+        os.replace(temporary_file, rollup_file)
+    except BaseException:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+        raise
+
+
+def load_rollups(filename: str) -> dict:
+    """
+    Returns the rollups of a CSV file, from the rollup file when it is
+    up to date and otherwise by reading the CSV file
+
+    Parameters:
+     filename (str): Name of the CSV file
+    """
+    rollup_file = rollup_file_for(filename)
+    key = source_key(filename)
+    rollups = load_rollup_cache(rollup_file, key)
+    if rollups is None:
+        rollups = read_rollups(filename)
+        try:
+            save_rollup_cache(rollup_file, key, rollups)
+        except OSError as e:
+            print(f"Could not write the rollup file {rollup_file}: {e}", file=sys.stderr)
+    return rollups
+
+
+class RollupIndex(EnergyIndex):
+    """
+    EnergyIndex over daily rollups instead of hourly rows
+
+    Date ranges use prefix sums over the days, and months
+    are read directly from the monthly rollups.
+
+    Parameters:
+     rollups (dict): Rollups from build_rollups() or load_rollups()
+    """
+
+    def __init__(self, rollups: dict):
+        daily = rollups["daily"]
+        columns = {"hours": [day[1] for day in daily]}
+        for position, column in enumerate(ENERGY_COLUMNS):
+            columns[column] = [day[position + 2] for day in daily]
+        super().__init__([datetime.fromisoformat(day[0]) for day in daily], columns)
+        self.months = {}
+        for month in rollups["monthly"]:
+            sums = dict(zip(ENERGY_COLUMNS, month[2:]))
+            self.months[date.fromisoformat(month[0])] = RangeTotals(month[1], sums)
+
+    def month_totals(self, year: int, month: int) -> RangeTotals:
+        """Returns the totals of one month from the monthly rollups"""
+        totals = self.months.get(date(year, month, 1))
+        return totals or RangeTotals(0, dict.fromkeys(ENERGY_COLUMNS, 0.0))
+
+    def year_totals(self, year: int) -> RangeTotals:
+        """Returns the totals of one year as the sum of its months"""
+        hours = 0
+        sums = dict.fromkeys(ENERGY_COLUMNS, 0.0)
+        for month in range(1, 13):
+            totals = self.month_totals(year, month)
+            hours += totals.hours
+            for column in ENERGY_COLUMNS:
+                sums[column] += totals.sums[column]
+        return RangeTotals(hours, sums)
+
+
+def load_rollup_index(filename: str) -> RollupIndex:
+    """
+    Returns a RollupIndex for a CSV file, using the rollup file when possible
+
+    Parameters:
+     filename (str): Name of the CSV file
+    """
+    return RollupIndex(load_rollups(filename))
+
+
+def main():
+    """Prints the load time without and with an up-to-date rollup file"""
+    filename = sys.argv[1] if len(sys.argv) > 1 else "2025.csv"
+    rollup_file = rollup_file_for(filename)
+    if os.path.exists(rollup_file):
+        os.remove(rollup_file)
+
+    started = time.perf_counter()
+    load_rollup_index(filename)
+    cold_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = load_rollup_index(filename)
+    warm_time = time.perf_counter() - started
+
+    print(f"Days: {len(index)}")
+    print(f"- hourly data read and rolled up: {cold_time * 1000:.1f} ms")
+    print(f"- rollups read from {rollup_file}: {warm_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
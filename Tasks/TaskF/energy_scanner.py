@@ -0,0 +1,335 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Memory-mapped scanner for the semicolon-separated energy files
+
+Reading a file with open() and split(";") creates a str object for every
+line and every field. The scanner maps the file into memory and decodes it
+CHUNK_BYTES at a time, whole lines per chunk. In a chunk the line breaks
+and semicolons are located with vectorized comparisons, the timestamp
+digits are read from fixed positions, and the numbers (e.g. 462 or -4,5)
+are decoded digit by digit for all rows at once. No Python object is
+created per row.
+
+Memory: the file itself is only mapped, but decoding is not free. The
+index and digit arrays of one chunk take several times CHUNK_BYTES, and the
+result takes 8 bytes per value, about the size of the file. While the
+chunks are joined the result exists twice. A 16 MB 2025.csv peaks at about
+28 MB of arrays, against 85 MB when the whole file was decoded at once.
+
+Both file layouts are recognised from the number of columns:
+2025.csv   -> time, consumption, production, temperature
+weekNN.csv -> time and six phase columns in Wh
+
+python energy_scanner.py [2025.csv] [years]
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+import traceback
+from datetime import datetime, timedelta
+
+from energy_loader import (
+    ENERGY_COLUMNS,
+    WEEK_COLUMNS,
+    decode_timestamps,
+    group_totals,
+    np,
+    python_summary,
+    read_data,
+    require_numpy,
+    write_years,
+)
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from instrumentation import best_time  # noqa: E402
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+SEMICOLON = ord(";")
+MAX_NUMBER_WIDTH = 16
+# Bytes decoded at a time, the temporary arrays of a chunk are several times its size
+CHUNK_BYTES = 1 << 22
+
+
+def parse_numbers(buffer, starts, ends):
+    """
+    Decodes decimal numbers such as 462, 0,000 or -4,5 from byte ranges
+
+    Parameters:
+     buffer (np.ndarray): uint8 view of the file
+     starts (np.ndarray): First byte of each number
+     ends (np.ndarray): Byte after the last byte of each number
+
+    Returns:
+     (mantissas, decimals): int64 digits without the separator and the
+     number of digits after the decimal separator
+    """
+    lengths = ends - starts
+    if len(lengths) and (lengths.min() < 1 or lengths.max() > MAX_NUMBER_WIDTH):
+        raise ValueError("empty or too long number in the file")
+    width = int(lengths.max()) if len(lengths) else 1
+    columns = np.arange(width)
+    inside = columns < lengths[:, None]
+    characters = buffer[np.where(inside, starts[:, None] + columns, starts[:, None])]
+
+    digit = inside & (characters >= ord("0")) & (characters <= ord("9"))
+    separator = inside & ((characters == ord(",")) | (characters == ord(".")))
+    sign = np.zeros_like(inside)
+    sign[:, 0] = (characters[:, 0] == ord("-")) | (characters[:, 0] == ord("+"))
+    if (inside & ~(digit | separator | sign)).any() or (separator.sum(axis=1) > 1).any():
+        raise ValueError("invalid number in the file")
+    if not digit.any(axis=1).all():
+        raise ValueError("number without digits in the file")
+
+    mantissas = np.zeros(len(starts), dtype=np.int64)
+    for column in range(width):
+        mantissas = np.where(digit[:, column], mantissas * 10 + characters[:, column] - ord("0"), mantissas)
+    decimals = (digit & (np.cumsum(separator, axis=1) > 0)).sum(axis=1)
+    mantissas[characters[:, 0] == ord("-")] *= -1
+    return mantissas, decimals
+
+
+def first_line_end(buffer, window: int = 4096) -> int:
+    """Returns the byte after the first line break, or the end of the buffer"""
+    for start in range(0, len(buffer), window):
+        newlines = np.flatnonzero(buffer[start : start + window] == NEWLINE)
+        if len(newlines):
+            return start + int(newlines[0]) + 1
+    return len(buffer)
+
+
+def chunk_end(buffer, start: int, size: int) -> int:
+    """
+    Returns the end of the chunk that starts at start: the byte after the
+    last line break within size bytes, or the end of the buffer
+
+    Parameters:
+     buffer (np.ndarray): uint8 view of the file
+     start (int): First byte of the chunk, the start of a line
+     size (int): Number of bytes to look at, more for a line longer than that
+    """
+    end = start + size
+    while end < len(buffer):
+        newlines = np.flatnonzero(buffer[end - size : end] == NEWLINE)
+        if len(newlines):
+            return end - size + int(newlines[-1]) + 1
+        end += size
+    return len(buffer)
+
+
+def scan_rows(buffer, columns: list[str]) -> dict:
+    """
+    Decodes complete data rows, without the header row
+
+    Parameters:
+     buffer (np.ndarray): uint8 view of the rows
+     columns (list[str]): ENERGY_COLUMNS or WEEK_COLUMNS
+
+    Returns:
+     data (dict): time and one array per column
+    """
+    newlines = np.flatnonzero(buffer == NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buffer)]))
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    # A line break may be \r\n
+    ends = ends - (buffer[ends - 1] == CARRIAGE_RETURN)
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+
+    separators = np.flatnonzero(buffer == SEMICOLON)
+    if len(separators) != len(starts) * len(columns):
+        raise ValueError("every row must have as many columns as the header")
+    separators = separators.reshape(len(starts), len(columns))
+    if len(starts) and ((separators[:, 0] <= starts).any() or (separators[:, -1] >= ends).any()):
+        raise ValueError("every row must have as many columns as the header")
+
+    if len(starts) and (separators[:, 0] - starts < 16).any():
+        raise ValueError("invalid timestamp in the file")
+    local = decode_timestamps(buffer[starts[:, None] + np.arange(16)])
+    if local is None:
+        raise ValueError("invalid timestamp in the file")
+
+    data = {"time": local}
+    field_ends = np.concatenate((separators[:, 1:], ends[:, None]), axis=1)
+    for position, column in enumerate(columns):
+        mantissas, decimals = parse_numbers(buffer, separators[:, position] + 1, field_ends[:, position])
+        if columns is WEEK_COLUMNS and not decimals.any():
+            data[column] = mantissas
+        else:
+            data[column] = mantissas / 10.0 ** decimals
+    return data
+
+
+def scan_buffer(buffer, chunk_bytes: int = CHUNK_BYTES) -> dict:
+    """
+    Decodes the rows of an energy file from its bytes, chunk_bytes at a time
+
+    Parameters:
+     buffer (np.ndarray): uint8 view of the whole file
+     chunk_bytes (int): Bytes decoded at a time, whole lines are kept together
+
+    Returns:
+     data (dict): Same arrays as energy_loader.load_energy_arrays()
+     or energy_loader.load_week_arrays()
+    """
+    header_end = first_line_end(buffer)
+    header = buffer[:header_end]
+    header_columns = int((header == SEMICOLON).sum())
+    if header_columns == 0:
+        raise ValueError("the header row has no columns separated by ;")
+    if header_columns == len(ENERGY_COLUMNS):
+        columns = ENERGY_COLUMNS
+    elif header_columns == len(WEEK_COLUMNS):
+        columns = WEEK_COLUMNS
+    else:
+        raise ValueError(f"unknown file layout with {header_columns + 1} columns")
+
+    parts = []
+    start = header_end
+    while start < len(buffer) or not parts:
+        end = chunk_end(buffer, start, chunk_bytes)
+        parts.append(scan_rows(buffer[start:end], columns))
+        start = end
+    if len(parts) == 1:
+        return parts[0]
+    # Week files have integer columns unless some chunk had decimals
+    return {column: np.concatenate([part[column] for part in parts]) for column in parts[0]}
+
+
+def scan_file(filename: str) -> dict:
+    """
+    Reads 2025.csv or a weekNN.csv file through a memory map
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     data (dict): Same arrays as energy_loader.load_energy_arrays()
+     or energy_loader.load_week_arrays()
+    """
+    require_numpy()
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{filename} is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffer = np.frombuffer(mapped, dtype=np.uint8)
+            error = None
+            try:
+                data = scan_buffer(buffer)
+            except ValueError as e:
+                # Keep only the message, the traceback still points to the map
+                error = str(e)
+            except BaseException as e:
+                # The frames of the traceback hold arrays that point to the map
+                traceback.clear_frames(e.__traceback__)
+                raise
+            finally:
+                # The map cannot be closed while an array still points to it
+                del buffer
+    if error is not None:
+        raise ValueError(f"{filename}: {error}")
+    return data
+
+
+def scan_totals(filename: str, unit: str) -> dict:
+    """
+    Scans a file and sums its columns by day ("D"), month ("M") or year ("Y")
+
+    Parameters:
+     filename (str): Name of the CSV file
+     unit (str): Grouping unit
+
+    Returns:
+     totals (dict): See energy_loader.group_totals()
+    """
+    return group_totals(scan_file(filename), unit)
+
+
+def split_week_totals(filename: str) -> dict:
+    """
+    Sums a week file per day with open() and split(";"), for comparison
+
+    Parameters:
+     filename (str): Name of the week file
+
+    Returns:
+     totals (dict): date -> six phase sums in Wh
+    """
+    totals = {}
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)
+        for line in f:
+            if len(line) > 1:
+                fields = line.strip().split(";")
+                day = datetime.fromisoformat(fields[0]).date()
+                sums = totals.setdefault(day, [0] * 6)
+                for phase in range(6):
+                    sums[phase] += int(fields[phase + 1])
+    return totals
+
+
+def write_weeks(source_file: str, target_file: str, weeks: int) -> None:
+    """
+    Writes a long week-format file by repeating one week with later dates
+
+    Parameters:
+     source_file (str): A weekNN.csv file
+     target_file (str): File to create
+     weeks (int): Number of weeks to write
+    """
+    with open(source_file, "r", encoding="utf-8") as f:
+        header = f.readline()
+        rows = [line.strip().split(";", 1) for line in f if len(line) > 1]
+    with open(target_file, "w", encoding="utf-8") as f:
+        f.write(header)
+        for week in range(weeks):
+            for moment, values in rows:
+                shifted = datetime.fromisoformat(moment) + timedelta(weeks=week)
+                f.write(f"{shifted.isoformat()};{values}\n")
+
+
+def main():
+    """Compares the scanner with open()/split(";") on generated large files"""
+    require_numpy()
+    source_file = sys.argv[1] if len(sys.argv) > 1 else "2025.csv"
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as folder:
+        energy_file = f"{folder}/energy.csv"
+        week_file = f"{folder}/weeks.csv"
+        write_years(source_file, energy_file, years)
+        write_weeks("../TaskE/week41.csv", week_file, years * 52)
+
+        expected, split_time = best_time(lambda: python_summary(read_data(energy_file), "D"))
+        scanned, scan_time = best_time(scan_totals, energy_file, "D")
+        for position, day in enumerate(scanned["keys"].astype(datetime)):
+            if abs(expected[day][1] - scanned["consumption"][position]) > 1e-6:
+                raise AssertionError(f"scanner and split() differ on {day}")
+        print(f"{energy_file.rsplit('/', 1)[1]}: {int(scanned['hours'].sum())} rows")
+        print(f"- open() and split(';'): {split_time:.3f} s")
+        print(f"- memory-mapped scanner: {scan_time:.3f} s ({split_time / scan_time:.1f}x)")
+
+        expected, split_time = best_time(split_week_totals, week_file)
+        scanned, scan_time = best_time(scan_totals, week_file, "D")
+        for position, day in enumerate(scanned["keys"].astype(datetime)):
+            if expected[day][0] != scanned["consumption_1"][position]:
+                raise AssertionError(f"scanner and split() differ on {day}")
+        print(f"{week_file.rsplit('/', 1)[1]}: {int(scanned['hours'].sum())} rows")
+        print(f"- open() and split(';'): {split_time:.3f} s")
+        print(f"- memory-mapped scanner: {scan_time:.3f} s ({split_time / scan_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Local report server for the annual energy data (Task F)
+
+The data is loaded once when the server starts, and any number of clients
+can then ask for the same reports as in the menu of energy_reports.py. The
+reports go through the ReportCache of energy_reports.py, so repeated reports
+are not built again and the data is loaded again if the file changes. The
+protocol is one command per line, and the answer is the report lines
+followed by an empty line:
+
+daily 1.3.2025 31.3.2025
+monthly 3            (month of the year of the data)
+monthly 3 2025
+yearly               (year of the data)
+yearly 2025
+stats                (hits and misses of the report cache)
+quit
+
+An invalid command, or a data file that cannot be read, is answered with
+a line starting with "ERROR" (and an empty line). Every client is served by
+its own coroutine, and the reports are built in a thread pool, so a slow or
+idle client does not hold up the others. The threads keep the event loop
+free while a report is built or the file is loaded again, but they share
+the GIL, so building several reports at once does not use more than one
+CPU. The reports are sums over the prefix-sum index and take well under a
+millisecond, so a process pool, which would need its own copy of the
+index in every process, would not pay off.
+
+python energy_server.py [2025.csv] [--host 127.0.0.1] [--port 8765] [--workers 4]
+
+Try it with e.g. nc 127.0.0.1 8765
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from energy_reports import ReportCache, parse_day
+
+IDLE_TIMEOUT = 300  # Seconds a client may stay silent before it is disconnected
+
+
+def answer_command(reports: ReportCache, line: str) -> list[str]:
+    """
+    Builds the report asked for by one command line
+
+    Parameters:
+     reports (ReportCache): Reports of the data file
+     line (str): Command, e.g. "monthly 3"
+
+    Returns:
+     lines (list[str]): Report lines
+
+    Raises:
+     ValueError: If the command or its values are invalid
+     OSError: If the data file changed and cannot be loaded again
+    """
+    words = line.split()
+    if not words:
+        raise ValueError("empty command")
+    command, values = words[0].lower(), words[1:]
+    _, index = reports.load()
+    year = index.first_day().year
+    match command, len(values):
+        case "daily", 2:
+            start, end = parse_day(values[0]), parse_day(values[1])
+            if end < start:
+                raise ValueError("the end date must not be before the start date")
+            return reports.daily_report(start, end)
+        case "monthly", 1 | 2:
+            month = int(values[0])
+            if not 1 <= month <= 12:
+                raise ValueError("the month number must be between 1 and 12")
+            return reports.monthly_report(month, int(values[1]) if len(values) == 2 else year)
+        case "yearly", 0 | 1:
+            return reports.yearly_report(int(values[0]) if values else year)
+        case "stats", 0:
+            info = reports.cache_info()
+            return [f"Report cache: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} reports"]
+    raise ValueError(f"unknown command: {line.strip()}")
+
+
+class ReportServer:
+    """
+    Serves reports from one loaded dataset to many clients
+
+    Parameters:
+     reports (ReportCache): Reports of the data file, shared by all clients
+     workers (int): Threads that build the reports
+    """
+
+    def __init__(self, reports: ReportCache, workers: int = 4):
+        self.reports = reports
+        self.executor = ThreadPoolExecutor(workers)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answers the commands of one client until it quits or disconnects"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except (asyncio.TimeoutError, ValueError):
+                    # Idle for too long, or a line longer than the stream limit
+                    break
+                if not data:
+                    break
+                line = data.decode("utf-8", errors="replace").strip()
+                if line.lower() == "quit":
+                    break
+                try:
+                    lines = await loop.run_in_executor(self.executor, answer_command, self.reports, line)
+                except (ValueError, OverflowError) as e:
+                    # e.g. a date or number outside the range that can be handled
+                    lines = [f"ERROR {e}"]
+                except OSError as e:
+                    # The data file could not be loaded again
+                    lines = [f"ERROR could not read the data file: {e}"]
+                writer.write(("\n".join(lines) + "\n\n").encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host: str, port: int) -> None:
+        """Accepts clients until the program is stopped"""
+        server = await asyncio.start_server(self.handle_client, host, port)
+        addresses = ", ".join(str(socket.getsockname()[:2]) for socket in server.sockets)
+        _, index = self.reports.load()
+        print(f"Serving reports of {index.first_day()}–{index.last_day()} on {addresses}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False)
+
+
+def main() -> None:
+    """Loads the data once and starts the server"""
+    parser = argparse.ArgumentParser(description="Serve the Task F energy reports")
+    parser.add_argument("file", nargs="?", default="2025.csv", help="energy data file (default: 2025.csv)")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("--workers", type=int, default=4, help="threads that build reports (default: 4)")
+    args = parser.parse_args()
+
+    server = ReportServer(ReportCache(args.file), args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Daily, monthly and yearly reports over any number of energy files,
+read one row at a time
+
+energy_reports.py reads a whole file into memory before the rollups are
+built. Here the files go through a pipeline of generators (lines -> rows ->
+days), and every row is added to the totals of its day as soon as it has
+been read, so only one row and one total per day are in memory at a time.
+The memory needed depends on the number of days, not on the number of rows,
+so ten years of hourly data or a year of 15-minute meter readings fit in the
+same few megabytes.
+
+The daily totals are rolled up to months in the format of energy_rollup.py,
+and the reports are the same as in energy_reports.py:
+
+python energy_stream.py 2015.csv 2016.csv ... [--daily 1.3.2025 31.3.2025]
+                        [--monthly 3 2025] [--yearly 2025]
+
+Without a report option the yearly report of every year is printed. The
+files are read in the given order and must not contain the same hours.
+Glob patterns such as "data/*.csv" are expanded.
+"""
+
+import argparse
+import glob
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from datetime import date
+
+from energy_reports import (
+    create_daily_report,
+    create_monthly_report,
+    create_yearly_report,
+    parse_day,
+    print_report_to_console,
+)
+from energy_rollup import RollupIndex
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from instrumentation import add_arguments, counted, enable_from_args, stage  # noqa: E402
+
+
+def iter_lines(files: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the data lines of the files one at a time, without the header rows
+
+    Parameters:
+     files (Iterable[str]): CSV files in the format of 2025.csv
+    """
+    for filename in files:
+        with open(filename, "r", encoding="utf-8") as f:
+            next(f, None)  # Header row
+            for line in f:
+                if len(line) > 1:
+                    yield line
+
+
+def iter_rows(lines: Iterable[str]) -> Iterator[tuple[str, float, float, float]]:
+    """
+    Converts lines to rows
+
+    The date part of the local timestamp is the day the row belongs to,
+    also on the days when summer time starts or ends, so the timestamp
+    does not need to be parsed.
+
+    Parameters:
+     lines (Iterable[str]): Lines such as 2025-01-01T00:00:00.000+02:00;1,569;0,000;-4,5
+
+    Returns:
+     (Iterator[tuple]): (ISO date, consumption kWh, production kWh, temperature °C)
+    """
+    for line in lines:
+        fields = line.replace(",", ".").split(";")
+        yield fields[0][:10], float(fields[1]), float(fields[2]), float(fields[3])
+
+
+def fold_days(rows: Iterable[tuple[str, float, float, float]]) -> dict[str, list]:
+    """
+    Adds every row to the totals of its day
+
+    Parameters:
+     rows (Iterable[tuple]): Rows from iter_rows()
+
+    Returns:
+     days (dict[str, list]): ISO date -> [hours, consumption, production, temperature sum]
+    """
+    days: dict[str, list] = {}
+    totals = None
+    current = None
+    for day, consumption, production, temperature in rows:
+        # The rows of a day follow each other, so the dictionary is seldom needed
+        if day != current:
+            current = day
+            totals = days.get(day)
+            if totals is None:
+                totals = days[day] = [0, 0.0, 0.0, 0.0]
+        totals[0] += 1
+        totals[1] += consumption
+        totals[2] += production
+        totals[3] += temperature
+    return days
+
+
+def roll_up(days: dict[str, list]) -> dict:
+    """
+    Sorts the daily totals and sums them per month
+
+    Parameters:
+     days (dict[str, list]): Result of fold_days()
+
+    Returns:
+     rollups (dict): "daily" and "monthly" lists in the format of
+     energy_rollup.build_rollups()
+    """
+    daily = [[day, *days[day]] for day in sorted(days)]
+    months: dict[str, list] = {}
+    for day, *totals in daily:
+        month = months.setdefault(day[:7] + "-01", [0, 0.0, 0.0, 0.0])
+        for position, value in enumerate(totals):
+            month[position] += value
+    return {"daily": daily, "monthly": [[month, *months[month]] for month in sorted(months)]}
+
+
+def stream_rollups(files: Iterable[str]) -> dict:
+    """
+    Reads the files one row at a time and returns their rollups
+
+    Parameters:
+     files (Iterable[str]): CSV files in the format of 2025.csv
+
+    Returns:
+     rollups (dict): See roll_up()
+    """
+    return roll_up(fold_days(iter_rows(counted("read", iter_lines(files)))))
+
+
+def expand_files(patterns: list[str]) -> list[str]:
+    """Expands glob patterns, names that match nothing are kept as they are"""
+    files = []
+    for pattern in patterns:
+        files.extend(sorted(glob.glob(pattern)) or [pattern])
+    return files
+
+
+def main() -> None:
+    """Reads the files and prints the chosen reports"""
+    parser = argparse.ArgumentParser(description="Energy reports over many files in constant memory")
+    parser.add_argument("files", nargs="+", help="CSV files or glob patterns, in date order")
+    parser.add_argument("--daily", nargs=2, metavar=("START", "END"), help="report for a date range, dd.mm.yyyy")
+    parser.add_argument("--monthly", nargs=2, type=int, metavar=("MONTH", "YEAR"), help="report for one month")
+    parser.add_argument("--yearly", type=int, metavar="YEAR", help="report for one year")
+    add_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(args)
+
+    with stage("fold") as measured:
+        index = RollupIndex(stream_rollups(expand_files(args.files)))
+        measured.rows = len(index)
+    if not len(index):
+        print("No data rows found.")
+        return
+
+    reports = []
+    with stage("report"):
+        if args.daily:
+            try:
+                start, end = parse_day(args.daily[0]), parse_day(args.daily[1])
+            except ValueError:
+                parser.error("the dates must be in the format dd.mm.yyyy")
+            reports.append(create_daily_report(index, start, end))
+        if args.monthly:
+            month, year = args.monthly
+            if not 1 <= month <= 12:
+                parser.error("the month number must be between 1 and 12")
+            reports.append(create_monthly_report(index, month, year))
+        if args.yearly:
+            reports.append(create_yearly_report(index, args.yearly))
+        if not reports:
+            first: date = index.first_day()
+            for year in range(first.year, index.last_day().year + 1):
+                reports.append(create_yearly_report(index, year))
+    with stage("print"):
+        for lines in reports:
+            print_report_to_console(lines)
+
+
+if __name__ == "__main__":
+    main()
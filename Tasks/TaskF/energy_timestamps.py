@@ -0,0 +1,215 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Fast decoder for the timezone-aware timestamps of 2025.csv
+
+2025-01-01T00:00:00.000+02:00   (winter time, UTC+2)
+2025-06-01T00:00:00.000+03:00   (summer time, UTC+3)
+
+All timestamps of a file are decoded at once into integer arrays:
+- day: local day as days since 1970-01-01, i.e. the day the hour belongs
+  to in the reports
+- month: local month as months since 1970-01
+- epoch_hour: hours since 1970-01-01 00:00 UTC, unique for every hour, also
+  for the repeated hour when summer time ends
+- offset: UTC offset in minutes (120 or 180 in Finland)
+
+The rows of one day share the same date prefix, so the date is only
+converted for the first row of each day and copied to the rest of the day.
+The hour and the UTC offset are read from fixed byte positions.
+
+The local day must be taken from the local date, not from the UTC time. With
+UTC (or a fixed +02:00) the first hours after midnight belong to the previous
+day in summer, and the days when summer time starts and ends do not get their
+23 and 25 hours.
+
+python energy_timestamps.py [2025.csv] [years]
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+
+from energy_loader import (
+    ENERGY_COLUMNS,
+    decode_timestamps,
+    group_by,
+    np,
+    python_summary,
+    read_data,
+    require_numpy,
+    split_fields,
+    write_years,
+)
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from instrumentation import best_time  # noqa: E402
+
+
+def decode_zoned_timestamps(timestamps: list[str]) -> dict:
+    """
+    Decodes YYYY-MM-DDTHH:MM...+HH:MM timestamps
+
+    Every timestamp must have the same length and end with the UTC
+    offset (+HH:MM or -HH:MM), or with Z for UTC.
+
+    Parameters:
+     timestamps (list[str]): Timestamps as text
+
+    Returns:
+     decoded (dict): day, month, epoch_hour and offset (int64 arrays)
+    """
+    require_numpy()
+    if not timestamps:
+        empty = np.array([], dtype=np.int64)
+        return {"day": empty, "month": empty, "epoch_hour": empty, "offset": empty}
+    width = len(timestamps[0])
+    joined = "".join(timestamps).encode("ascii", errors="replace")
+    if width < 17 or len(joined) != width * len(timestamps):
+        raise ValueError("timestamps of different length or without a UTC offset")
+    characters = np.frombuffer(joined, dtype=np.uint8).reshape(-1, width)
+
+    # Parse the date and time only where the date prefix changes. The first
+    # 8 + 2 bytes of each row are compared as two integers.
+    prefix = np.frombuffer(joined, dtype=np.dtype([("head", "<u8"), ("tail", "<u2"), ("rest", f"V{width - 10}")]))
+    first = np.ones(len(timestamps), dtype=bool)
+    first[1:] = (prefix["head"][1:] != prefix["head"][:-1]) | (prefix["tail"][1:] != prefix["tail"][:-1])
+    starts = np.flatnonzero(first)
+    local = decode_timestamps(characters[starts, :16])
+    hours = characters[:, [11, 12, 14, 15]].astype(np.int64) - ord("0")
+    if local is None or ((hours < 0) | (hours > 9)).any() or (characters[:, 10] != ord("T")).any():
+        raise ValueError("invalid timestamp")
+    minutes = (hours[:, 0] * 10 + hours[:, 1]) * 60 + hours[:, 2] * 10 + hours[:, 3]
+    if (minutes >= 1440).any():
+        raise ValueError("invalid timestamp")
+    day = np.repeat(local.astype("datetime64[D]").astype(np.int64), np.diff(np.append(starts, len(timestamps))))
+
+    offset = np.zeros(len(timestamps), dtype=np.int64)
+    utc = characters[:, -1] == ord("Z")
+    zoned = ~utc
+    if zoned.any():
+        suffix = characters[zoned][:, -6:]
+        digits = suffix[:, [1, 2, 4, 5]].astype(np.int64) - ord("0")
+        sign = np.where(suffix[:, 0] == ord("-"), -1, 1)
+        if (
+            ((suffix[:, 0] != ord("+")) & (suffix[:, 0] != ord("-"))).any()
+            or (suffix[:, 3] != ord(":")).any()
+            or ((digits < 0) | (digits > 9)).any()
+        ):
+            raise ValueError("timestamp without a UTC offset")
+        offset[zoned] = sign * ((digits[:, 0] * 10 + digits[:, 1]) * 60 + digits[:, 2] * 10 + digits[:, 3])
+
+    return {
+        "day": day,
+        "month": day.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64),
+        "epoch_hour": (day * 1440 + minutes - offset) // 60,
+        "offset": offset,
+    }
+
+
+def local_day_of(epoch_hour, offset):
+    """
+    Returns the local day (days since 1970-01-01) of epoch hours
+
+    Parameters:
+     epoch_hour (int | np.ndarray): Hours since 1970-01-01 00:00 UTC
+     offset (int | np.ndarray): UTC offset of the local time in minutes
+    """
+    return (epoch_hour * 60 + offset) // 1440
+
+
+def load_zoned_arrays(filename: str) -> dict:
+    """
+    Reads 2025.csv into NumPy arrays with decoded timestamps
+
+    Parameters:
+     filename (str): Name of the CSV file
+
+    Returns:
+     data (dict): The arrays of decode_zoned_timestamps() and
+     consumption, production and temperature (float64)
+    """
+    fields = split_fields(filename, 4)
+    data = decode_zoned_timestamps(fields[0])
+    for column, values in zip(ENERGY_COLUMNS, fields[1:]):
+        data[column] = np.array(values, dtype=np.float64)
+    return data
+
+
+def key_totals(data: dict, key: str) -> dict:
+    """
+    Sums the columns by local day or month
+
+    Parameters:
+     data (dict): Result of load_zoned_arrays()
+     key (str): "day" or "month"
+
+    Returns:
+     totals (dict): date (first day of the month for months) ->
+     [hours, consumption, production, temperature sum], the same as
+     energy_loader.python_summary()
+    """
+    totals = group_by(data[key], {column: data[column] for column in ENERGY_COLUMNS})
+    unit = "D" if key == "day" else "M"
+    dates = totals["keys"].astype(f"datetime64[{unit}]").astype("datetime64[D]").astype(date)
+    columns = [totals["hours"].tolist()] + [totals["sum"][column].tolist() for column in ENERGY_COLUMNS]
+    return {day: [values[i] for values in columns] for i, day in enumerate(dates)}
+
+
+def main():
+    """
+    Compares the decoder with datetime.fromisoformat() and shows how the
+    hours of the summer-time changes are assigned to days
+    """
+    require_numpy()
+    source_file = sys.argv[1] if len(sys.argv) > 1 else "2025.csv"
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as folder:
+        filename = f"{folder}/energy.csv"
+        write_years(source_file, filename, years)
+        timestamps = split_fields(filename, 4)[0]
+
+        parsed, iso_time = best_time(lambda: [datetime.fromisoformat(timestamp) for timestamp in timestamps])
+        decoded, decode_time = best_time(decode_zoned_timestamps, timestamps)
+
+        expected_days = np.array([moment.date() for moment in parsed], dtype="datetime64[D]").astype(np.int64)
+        expected_hours = np.array([int(moment.timestamp()) // 3600 for moment in parsed])
+        if not (decoded["day"] == expected_days).all() or not (decoded["epoch_hour"] == expected_hours).all():
+            raise AssertionError("decoder and fromisoformat() differ")
+        if len(np.unique(decoded["epoch_hour"])) != len(timestamps):
+            raise AssertionError("two rows have the same epoch hour")
+        print(f"{len(timestamps)} timestamps")
+        print(f"- datetime.fromisoformat(): {iso_time * 1000:.1f} ms")
+        print(f"- decode_zoned_timestamps(): {decode_time * 1000:.1f} ms ({iso_time / decode_time:.1f}x)")
+
+        expected, python_time = best_time(lambda: python_summary(read_data(filename), "D"))
+        data, load_time = best_time(load_zoned_arrays, filename)
+        totals, totals_time = best_time(key_totals, data, "day")
+        zoned_time = load_time + totals_time
+        for day, total in expected.items():
+            if totals[day][0] != total[0] or abs(totals[day][1] - total[1]) > 1e-6:
+                raise AssertionError(f"daily totals differ on {day}")
+        print(f"Daily totals of {years} years ({len(totals)} days)")
+        print(f"- read_data() and python_summary(): {python_time:.2f} s")
+        print(f"- load_zoned_arrays() and key_totals(): {zoned_time:.2f} s ({python_time / zoned_time:.1f}x)")
+
+    # Days with a summer-time change in the first year, by local date and by a fixed UTC+2
+    fixed_days = local_day_of(data["epoch_hour"], 120)
+    first_year = min(totals).year
+    for day, total in sorted(totals.items()):
+        if total[0] != 24 and day.year == first_year:
+            fixed = int((fixed_days == np.datetime64(day, "D").astype(np.int64)).sum())
+            print(f"- {day}: {total[0]} hours by local date, {fixed} hours with a fixed +02:00")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Compares the fast date parsing of convert_reservation_data() against
+the original strptime version
+
+The script writes a large reservations file to a temporary folder,
+converts every row with both versions, checks that the results are
+identical and prints the times:
+
+python benchmark_parsing.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time as timer
+from datetime import datetime
+
+from read_reservations import convert_reservation_data, parse_date, parse_time
+
+# The reservation files are generated with the generator of the benchmarks
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Benchmarks"))
+from generate_data import write_reservations  # noqa: E402
+
+
+def convert_reservation_data_strptime(reservation: list) -> list:
+    """
+    The original conversion that calls strptime three times per row
+
+    Parameters:
+     reservation (list): Unconverted reservation -> 11 columns
+
+    Returns:
+     converted (list): Converted data types
+    """
+    converted = []
+    converted.append(int(reservation[0]))
+    converted.append(str(reservation[1]))
+    converted.append(str(reservation[2]))
+    converted.append(str(reservation[3]))
+    converted.append(datetime.strptime(reservation[4], "%Y-%m-%d").date())
+    converted.append(datetime.strptime(reservation[5], "%H:%M").time())
+    converted.append(int(reservation[6]))
+    converted.append(float(reservation[7]))
+    converted.append(True if reservation[8].strip() == 'True' else False)
+    converted.append(str(reservation[9]))
+    converted.append(datetime.strptime(str(reservation[10]).strip(), "%Y-%m-%d %H:%M:%S"))
+    return converted
+
+
+def time_conversion(converter, lines: list[list]) -> tuple[list, float]:
+    """
+    Converts all rows and measures the time
+
+    Parameters:
+     converter (function): Conversion function to measure
+     lines (list): Rows split by |
+
+    Returns:
+     (converted, seconds): Converted rows and elapsed time
+    """
+    started = timer.perf_counter()
+    converted = [converter(fields) for fields in lines]
+    return converted, timer.perf_counter() - started
+
+
+def check_invalid_input() -> None:
+    """Checks that invalid dates and times still raise ValueError"""
+    for parser, text in ((parse_date, "2025-02-30"), (parse_date, "2025/02/01"), (parse_time, "25:00")):
+        try:
+            parser(text)
+        except ValueError:
+            continue
+        raise AssertionError(f"{text} should not be accepted")
+
+
+def main():
+    """Runs the benchmark and prints the results"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as folder:
+        filename = f"{folder}/reservations.txt"
+        write_reservations(filename, rows)
+        with open(filename, "r", encoding="utf-8") as f:
+            lines = [line.split("|") for line in f if len(line) > 1]
+
+    check_invalid_input()
+    slow, slow_time = time_conversion(convert_reservation_data_strptime, lines)
+    fast, fast_time = time_conversion(convert_reservation_data, lines)
+    if slow != fast:
+        raise AssertionError("fast parsing gave different results")
+
+    print(f"Reservations: {rows}")
+    print(f"- strptime: {slow_time:.2f} s")
+    print(f"- fast parsing: {fast_time:.2f} s")
+    print(f"- speedup: {slow_time / fast_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Reads a large reservations file with several processes
+
+The file is split into byte ranges that start and end at line breaks.
+Each range is parsed in its own process with convert_reservation_data(),
+and the results are joined back together in file order, so the result is
+the same as with fetch_reservations(). Instead of the reservations, the
+processes can also return one ReportAccumulator each, which is much less
+data to send back when only the report is needed.
+
+The revenue of the merged report is the math.fsum() of the revenues of
+the ranges. Floating-point additions in a different order round
+differently, so it can differ from the one-by-one sum over
+fetch_reservations() in the last digits. The rounded euros and cents are
+the same, and main() compares the two with a relative tolerance of 1e-9.
+
+python parallel_loader.py [reservations.txt] [--workers 4] [--sections 4,5]
+"""
+
+import argparse
+import io
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from read_reservations import HEADERS, convert_reservation_data, fetch_reservations
+from report_engine import ReportAccumulator, parse_sections
+
+
+def split_file(reservation_file: str, chunks: int) -> list[tuple[int, int]]:
+    """
+    Splits a file into byte ranges that end at line breaks
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     chunks (int): Wanted number of ranges
+
+    Returns:
+     ranges (list[tuple[int, int]]): (start, end) byte positions in file order
+    """
+    size = os.path.getsize(reservation_file)
+    chunk_size = max(1, size // max(1, chunks))
+    ranges = []
+    with open(reservation_file, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()  # Move to the end of the line we landed in
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_range(reservation_file: str, start: int, end: int) -> io.TextIOWrapper:
+    """
+    Opens one byte range of a file as text, decoded the same way as open()
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     start (int): First byte
+     end (int): Byte after the last one
+    """
+    with open(reservation_file, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+
+
+def parse_range(job: tuple[str, int, int]) -> list[list]:
+    """
+    Converts the reservations in one byte range
+
+    Parameters:
+     job (tuple): (reservation_file, start, end)
+
+    Returns:
+     reservations (list[list]): Converted reservations, no header row
+    """
+    reservations = []
+    for line in read_range(*job):
+        if len(line) > 1:
+            reservations.append(convert_reservation_data(line.split("|")))
+    return reservations
+
+
+def report_range(job: tuple[str, int, int, list[str] | None]) -> ReportAccumulator:
+    """
+    Collects the report sections of one byte range
+
+    Parameters:
+     job (tuple): (reservation_file, start, end, sections)
+
+    Returns:
+     report (ReportAccumulator): Partial report of the range
+    """
+    reservation_file, start, end, sections = job
+    report = ReportAccumulator(sections)
+    for line in read_range(reservation_file, start, end):
+        if len(line) > 1:
+            report.add(convert_reservation_data(line.split("|")))
+    return report
+
+
+def fetch_reservations_parallel(reservation_file: str, workers: int | None = None) -> list[list]:
+    """
+    Reads reservations like fetch_reservations() but with several processes
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     workers (int): Number of processes, by default the number of CPUs
+
+    Returns:
+     reservations (list): Header row and converted reservations
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return fetch_reservations(reservation_file)
+    jobs = [(reservation_file, start, end) for start, end in split_file(reservation_file, workers * 4)]
+    reservations = [list(HEADERS)]
+    with ProcessPoolExecutor(workers) as executor:
+        for part in executor.map(parse_range, jobs):
+            reservations.extend(part)
+    return reservations
+
+
+def build_report_parallel(
+    reservation_file: str, sections: list[str] | None = None, workers: int | None = None
+) -> ReportAccumulator:
+    """
+    Collects the report sections with several processes and merges
+    the partial reports in file order
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     sections (list[str]): Section keys, all sections by default
+     workers (int): Number of processes, by default the number of CPUs
+
+    Returns:
+     report (ReportAccumulator): Collected report
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(reservation_file, start, end, sections) for start, end in split_file(reservation_file, workers * 4)]
+    if workers == 1:
+        return merge_reports(map(report_range, jobs), sections)
+    with ProcessPoolExecutor(workers) as executor:
+        return merge_reports(executor.map(report_range, jobs), sections)
+
+
+def merge_reports(parts, sections: list[str] | None = None) -> ReportAccumulator:
+    """
+    Merges partial reports in order, adding up the revenues with math.fsum()
+
+    Parameters:
+     parts (Iterable[ReportAccumulator]): Partial reports in file order
+     sections (list[str]): Section keys, all sections by default
+
+    Returns:
+     report (ReportAccumulator): Merged report
+    """
+    report = ReportAccumulator(sections)
+    revenues = []
+    for part in parts:
+        report.merge(part)
+        revenues.append(part.revenue)
+    report.revenue = math.fsum(revenues)
+    return report
+
+
+def main():
+    """
+    Reads the reservations serially and in parallel, checks that the results
+    are identical and prints the times and the selected report sections
+    """
+    parser = argparse.ArgumentParser(description="Read reservations with several processes")
+    parser.add_argument("file", nargs="?", default="reservations.txt", help="reservation file")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPUs)")
+    parser.add_argument("--sections", type=parse_sections, default=["summary", "revenue"], help="report sections to print")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    serial = fetch_reservations(args.file)
+    serial_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parallel = fetch_reservations_parallel(args.file, args.workers)
+    parallel_time = time.perf_counter() - started
+
+    if serial != parallel:
+        raise AssertionError("parallel loading gave different results")
+
+    started = time.perf_counter()
+    report = build_report_parallel(args.file, args.sections, args.workers)
+    report_time = time.perf_counter() - started
+
+    expected = ReportAccumulator(args.sections)
+    for reservation in serial[1:]:
+        expected.add(reservation)
+    # The revenue is summed in a different order, see the module docstring
+    if not math.isclose(report.revenue, expected.revenue, rel_tol=1e-9):
+        raise AssertionError("parallel report gave a different revenue")
+
+    print(f"Reservations: {len(serial) - 1}")
+    print(f"- fetch_reservations: {serial_time:.2f} s")
+    print(f"- fetch_reservations_parallel: {parallel_time:.2f} s")
+    print(f"- build_report_parallel: {report_time:.2f} s")
+    report.print_report()
+
+
+if __name__ == "__main__":
+    main()
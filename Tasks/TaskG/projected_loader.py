@@ -0,0 +1,270 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Reservation loading that converts only the fields a report needs
+
+convert_reservation_data() converts all 11 fields of every reservation,
+including the dates and the createdAt timestamp. total_revenue() only needs
+durationHours, price and confirmed. The projected loader is given the fields
+that are needed: those are converted while the file is read, and the line is
+only split as far as the last of them. The other fields stay as text and are
+converted the first time they are read, e.g. the name of a confirmed
+reservation when it is printed. Fields that are never read are never
+converted.
+
+A LazyReservation is a read-only sequence that supports list indices
+(reservation[8]), negative indices (reservation[-2]), slices and field
+names (reservation["confirmed"]), so the report functions of
+read_reservations.py work without changes. Use to_list() to get a real
+list, e.g. for json.dumps(). An invalid value in a lazy field is noticed
+only when the field is read.
+
+python projected_loader.py [reservations.txt] [rows]
+"""
+
+import contextlib
+import os
+import sys
+import tempfile
+import time as timer
+from collections.abc import Iterable, Sequence
+
+from read_reservations import (
+    HEADERS,
+    confirmation_summary,
+    fetch_reservations,
+    parse_date,
+    parse_datetime,
+    parse_time,
+    total_revenue,
+)
+from reservation_table import COLUMNS
+
+# The reservation files are generated with the generator of the benchmarks
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Benchmarks"))
+from generate_data import write_reservations  # noqa: E402
+
+# Fields each report function of read_reservations.py reads
+REPORT_FIELDS = {
+    "confirmed": {"name", "reservationDate", "reservationTime", "confirmed", "reservedResource"},
+    "long": {"name", "reservationDate", "reservationTime", "durationHours", "reservedResource"},
+    "statuses": {"name", "confirmed"},
+    "summary": {"confirmed"},
+    "revenue": {"durationHours", "price", "confirmed"},
+}
+
+
+def _convert_confirmed(text: str) -> bool:
+    return text.strip() == "True"
+
+
+def _convert_created(text: str):
+    return parse_datetime(text.strip())
+
+
+# Same conversions as convert_reservation_data(), one per column
+CONVERTERS = [int, str, str, str, parse_date, parse_time, int, float, _convert_confirmed, str, _convert_created]
+
+
+def field_columns(fields: Iterable) -> tuple[int, ...]:
+    """
+    Converts field names or column numbers to sorted column numbers
+
+    Parameters:
+     fields (Iterable): e.g. {"price", "confirmed"} or [7, 8]
+    """
+    columns = set()
+    for field in fields:
+        column = COLUMNS.get(field, -1) if isinstance(field, str) else field
+        if not 0 <= column < len(HEADERS):
+            raise ValueError(f"Unknown reservation field: {field}")
+        columns.add(column)
+    return tuple(sorted(columns))
+
+
+def report_fields(reports: Iterable[str]) -> set[str]:
+    """
+    Returns the fields the given reports read
+
+    Parameters:
+     reports (Iterable[str]): Keys of REPORT_FIELDS
+    """
+    fields = set()
+    for report in reports:
+        fields |= REPORT_FIELDS[report]
+    return fields
+
+
+# Marks a field that has not been converted yet
+_UNCONVERTED = object()
+
+
+class LazyReservation(Sequence):
+    """
+    One reservation whose fields are converted on first access
+
+    The converted values are kept in a list of 11 items, so reading a field
+    that is already converted is one list lookup. The other items hold
+    _UNCONVERTED until the field is first read. The object behaves like the
+    list of convert_reservation_data(): len() is 11, iterating gives the
+    converted values, and it is equal to a list with the same values.
+
+    The split fields are kept as a tuple: a tuple of strings is not
+    followed by the garbage collector, which matters with a million rows.
+
+    Parameters:
+     fields (tuple[str, ...]): Line of the reservation file split at "|",
+                               the last item may still contain the rest of the line
+     values (list): Converted values, _UNCONVERTED for the others
+    """
+
+    __slots__ = ("_fields", "_values")
+
+    def __init__(self, fields: tuple[str, ...], values: list | None = None):
+        self._fields = fields
+        self._values = [_UNCONVERTED] * len(HEADERS) if values is None else values
+
+    def __getitem__(self, key):
+        try:
+            value = self._values[key]
+        except TypeError:
+            if isinstance(key, str):
+                return self[COLUMNS[key]]
+            raise
+        if value is _UNCONVERTED:
+            return self._convert(key % len(HEADERS))
+        if isinstance(key, slice):
+            return [self[column] for column in range(len(HEADERS))[key]]
+        return value
+
+    def _convert(self, column: int):
+        """Converts one field and keeps the value"""
+        fields = self._fields
+        if column >= len(fields) - 1 and len(fields) < len(HEADERS):
+            # Fields after the last projected column were left in one piece
+            fields = self._fields = fields[:-1] + tuple(fields[-1].split("|"))
+        value = self._values[column] = CONVERTERS[column](fields[column])
+        return value
+
+    def __len__(self) -> int:
+        return len(HEADERS)
+
+    def __iter__(self):
+        return (self[column] for column in range(len(HEADERS)))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, LazyReservation)):
+            return NotImplemented
+        # Compared field by field, so e.g. comparing with HEADERS stops at the first field
+        return len(other) == len(HEADERS) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # Not hashable, like a list
+
+    def __repr__(self) -> str:
+        return repr(self.to_list())
+
+    def converted(self) -> int:
+        """Returns the number of fields converted so far"""
+        return sum(value is not _UNCONVERTED for value in self._values)
+
+    def to_list(self) -> list:
+        """Returns the reservation in the same form as convert_reservation_data()"""
+        return list(self)
+
+
+def line_projector(fields: Iterable):
+    """
+    Returns a function that converts one line of the reservation file
+    to a LazyReservation, converting the given fields immediately
+
+    Parameters:
+     fields (Iterable): Field names or column numbers
+    """
+    columns = field_columns(fields)
+    converters = list(zip(columns, [CONVERTERS[column] for column in columns]))
+    maxsplit = columns[-1] + 1 if columns else 0
+    unconverted = [_UNCONVERTED] * len(HEADERS)
+
+    def project(line: str) -> LazyReservation:
+        fields = tuple(line.split("|", maxsplit))
+        values = unconverted.copy()
+        for column, convert in converters:
+            values[column] = convert(fields[column])
+        return LazyReservation(fields, values)
+
+    return project
+
+
+def iter_projected(reservation_file: str, fields: Iterable) -> Iterable[LazyReservation]:
+    """
+    Reads reservations one at a time, converting only the given fields
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     fields (Iterable): Field names or column numbers to convert while reading
+    """
+    project = line_projector(fields)
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(line) > 1:
+                yield project(line)
+
+
+def fetch_reservations_projected(reservation_file: str, fields: Iterable) -> list:
+    """
+    Reads reservations like fetch_reservations(), converting only the given fields
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     fields (Iterable): Field names or column numbers to convert while reading
+
+    Returns:
+     reservations (list): Header row followed by LazyReservation objects
+    """
+    return [list(HEADERS), *iter_projected(reservation_file, fields)]
+
+
+def main():
+    """
+    Compares the summary reports with fetch_reservations() and with the
+    projected loader on a generated file
+    """
+    source_file = sys.argv[1] if len(sys.argv) > 1 else "reservations.txt"
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    for lazy, full in zip(fetch_reservations_projected(source_file, ["price"])[1:], fetch_reservations(source_file)[1:]):
+        if lazy.to_list() != full:
+            raise AssertionError(f"projected and full conversion differ: {full}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        filename = f"{folder}/reservations.txt"
+        write_reservations(filename, rows)
+        fields = report_fields(["summary", "revenue"])
+        for title, load in (
+            ("fetch_reservations()", lambda: fetch_reservations(filename)),
+            ("fetch_reservations_projected()", lambda: fetch_reservations_projected(filename, fields)),
+        ):
+            best = None
+            for _ in range(3):
+                # Release the previous list first, so it does not slow down the garbage collector
+                reservations = None
+                started = timer.perf_counter()
+                reservations = load()
+                with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+                    confirmation_summary(reservations)
+                    total_revenue(reservations)
+                elapsed = timer.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"{title:<32}{best:.2f} s for the summary and revenue of {rows} rows (best of 3)")
+        converted = sum(reservation.converted() for reservation in reservations[1:])
+        print(f"Converted fields: {converted} of {len(HEADERS) * rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,99 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+from datetime import date, datetime, time
+from functools import lru_cache
+
+HEADERS = [
+    "reservationId",
+    "name",
+    "email",
+    "phone",
+    "reservationDate",
+    "reservationTime",
+    "durationHours",
+    "price",
+    "confirmed",
+    "reservedResource",
+    "createdAt",
+]
+
+
+def _is_digits(text: str) -> bool:
+    """Checks that the text contains only the ASCII digits 0-9"""
+    return text.isascii() and text.isdigit()
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> date:
+    """
+    Converts a date in the format YYYY-MM-DD to a date object
+
+    The fixed layout is checked by slicing and converted with fromisoformat,
+    which is many times faster than strptime. Any other input is given to
+    strptime, so invalid dates raise the same ValueError as before.
+    Reservations share a small number of dates, so the results are cached.
+
+    Parameters:
+     text (str): Date as text, e.g. 2025-11-12
+
+    Returns:
+     (date): Converted date
+    """
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        digits = text[:4] + text[5:7] + text[8:]
+        if _is_digits(digits):
+            try:
+                return date.fromisoformat(text)
+            except ValueError:
+                pass
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=2048)
+def parse_time(text: str) -> time:
+    """
+    Converts a time in the format HH:MM to a time object
+
+    Parameters:
+     text (str): Time as text, e.g. 09:00
+
+    Returns:
+     (time): Converted time
+    """
+    if len(text) == 5 and text[2] == ":" and _is_digits(text[:2] + text[3:]):
+        try:
+            return time(int(text[:2]), int(text[3:]))
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%H:%M").time()
+
+
+def parse_datetime(text: str) -> datetime:
+    """
+    Converts a timestamp in the format YYYY-MM-DD HH:MM:SS to a datetime object
+
+    Parameters:
+     text (str): Timestamp as text, e.g. 2025-08-12 14:33:20
+
+    Returns:
+     (datetime): Converted timestamp
+    """
+    if (
+        len(text) == 19
+        and text[4] == "-"
+        and text[7] == "-"
+        and text[10] == " "
+        and text[13] == ":"
+        and text[16] == ":"
+    ):
+        digits = text[:4] + text[5:7] + text[8:10] + text[11:13] + text[14:16] + text[17:]
+        if _is_digits(digits):
+            try:
+                return datetime.fromisoformat(text)
+            except ValueError:
+                pass
+    return datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
 
 
 def convert_reservation_data(reservation: list) -> list:
@@ -38,13 +130,13 @@ def convert_reservation_data(reservation: list) -> list:
     converted.append(str(reservation[1]))  # name (str)
     converted.append(str(reservation[2]))  # email (str)
     converted.append(str(reservation[3]))  # phone (str)
-    converted.append(datetime.strptime(reservation[4], "%Y-%m-%d").date())  # reservationDate (date)
-    converted.append(datetime.strptime(reservation[5], "%H:%M").time())  # reservationTime (time)
+    converted.append(parse_date(reservation[4]))  # reservationDate (date)
+    converted.append(parse_time(reservation[5]))  # reservationTime (time)
     converted.append(int(reservation[6]))  # durationHours (int)
     converted.append(float(reservation[7]))  # price (float)
     converted.append(True if reservation[8].strip() == 'True' else False)  # confirmed (bool)
     converted.append(str(reservation[9]))  # reservedResource (str)
-    converted.append(datetime.strptime(str(reservation[10]).strip(), "%Y-%m-%d %H:%M:%S"))  # createdAt (datetime)
+    converted.append(parse_datetime(str(reservation[10]).strip()))  # createdAt (datetime)
     return converted
 
 
@@ -60,21 +152,7 @@ def fetch_reservations(reservation_file: str) -> list[list]:
      reservations (list): Read and converted reservations
     """
     reservations = []
-    reservations.append(
-        [
-            "reservationId",
-            "name",
-            "email",
-            "phone",
-            "reservationDate",
-            "reservationTime",
-            "durationHours",
-            "price",
-            "confirmed",
-            "reservedResource",
-            "createdAt",
-        ]
-    )
+    reservations.append(list(HEADERS))
     with open(reservation_file, "r", encoding="utf-8") as f:
         for line in f:
             if len(line) > 1:
@@ -82,6 +160,98 @@ def fetch_reservations(reservation_file: str) -> list[list]:
                 reservations.append(convert_reservation_data(fields))
     return reservations
 
+@lru_cache(maxsize=4096)
+def format_date(value: date) -> str:
+    """
+    Format a date as dd.mm.yyyy
+
+    Reservations share a small number of dates,
+    so each date is formatted only once.
+
+    Parameters:
+     value (date): Date to format
+    """
+    return value.strftime("%d.%m.%Y")
+
+@lru_cache(maxsize=2048)
+def format_time(value: time) -> str:
+    """
+    Format a time as hh.mm
+
+    Parameters:
+     value (time): Time to format
+    """
+    return value.strftime("%H.%M")
+
+@lru_cache(maxsize=4096)
+def format_iso_date(value: date) -> str:
+    """
+    Format a date as yyyy-mm-dd for CSV and JSON output
+
+    Parameters:
+     value (date): Date to format
+    """
+    return value.isoformat()
+
+@lru_cache(maxsize=2048)
+def format_iso_time(value: time) -> str:
+    """
+    Format a time as hh:mm for CSV and JSON output
+
+    Parameters:
+     value (time): Time to format
+    """
+    return value.strftime("%H:%M")
+
+def format_confirmed(reservation: list) -> str:
+    """
+    Format one row of the confirmed reservations report
+
+    Parameters:
+     reservation (list): Reservation
+    """
+    return f'- {reservation[1]}, {reservation[-2]}, {format_date(reservation[4])} at {format_time(reservation[5])}'
+
+def format_long(reservation: list) -> str:
+    """
+    Format one row of the long reservations report
+
+    Parameters:
+     reservation (list): Reservation
+    """
+    return f'- {reservation[1]}, {format_date(reservation[4])} at {format_time(reservation[5])}, duration {reservation[6]} h, {reservation[-2]}'
+
+def format_status(reservation: list) -> str:
+    """
+    Format one row of the confirmation status report
+
+    Parameters:
+     reservation (list): Reservation
+    """
+    name : str = reservation[1]
+    confirmed : bool = reservation[8]
+
+    return f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}'
+
+def format_summary(confirmed: int, not_confirmed: int) -> str:
+    """
+    Format the confirmation summary
+
+    Parameters:
+     confirmed (int): Number of confirmed reservations
+     not_confirmed (int): Number of reservations that are not confirmed
+    """
+    return f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {not_confirmed} pcs'
+
+def format_revenue(revenue: float) -> str:
+    """
+    Format the total revenue
+
+    Parameters:
+     revenue (float): Revenue from confirmed reservations
+    """
+    return f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ',')
+
 def confirmed_reservations(reservations: list[list]) -> None:
     """
     Print confirmed reservations
@@ -91,7 +261,7 @@ def confirmed_reservations(reservations: list[list]) -> None:
     """
     for reservation in reservations[1:]:
         if reservation[8]: # If confirmed
-            print(f'- {reservation[1]}, {reservation[-2]}, {reservation[4].strftime("%d.%m.%Y")} at {reservation[5].strftime("%H.%M")}')
+            print(format_confirmed(reservation))
 
 def long_reservations(reservations : list[list]) -> None:
     """
@@ -102,7 +272,7 @@ def long_reservations(reservations : list[list]) -> None:
     """
     for reservation in reservations[1:]:
         if reservation[6] >= 3: # If long
-            print(f'- {reservation[1]}, {reservation[4].strftime("%d.%m.%Y")} at {reservation[5].strftime("%H.%M")}, duration {reservation[6]} h, {reservation[-2]}')
+            print(format_long(reservation))
 
 
 def confirmation_statuses(reservations: list[list]) -> None:
@@ -113,10 +283,7 @@ def confirmation_statuses(reservations: list[list]) -> None:
      reservations (list): Reservations
     """
     for reservation in reservations[1:]:
-        name : str = reservation[1]
-        confirmed : bool = reservation[8]
-
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+        print(format_status(reservation))
 
 def confirmation_summary(reservations: list[list]) -> None:
     """
@@ -126,7 +293,7 @@ def confirmation_summary(reservations: list[list]) -> None:
      reservations (list): Reservations
     """
     confirmed : int = len([x for x in reservations[1:] if x[8]])
-    print(f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {len(reservations) - confirmed - 1} pcs')
+    print(format_summary(confirmed, len(reservations) - confirmed - 1))
 
 def total_revenue(reservations: list[list]) -> None:
     """
@@ -136,7 +303,7 @@ def total_revenue(reservations: list[list]) -> None:
      reservations (list): Reservations
     """
     revenue : float = sum(x[6] * x[7] for x in reservations[1:] if x[8])
-    print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
+    print(format_revenue(revenue))
 
 def main():
     """
@@ -0,0 +1,317 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Prints the five reservation reports of read_reservations.py
+with a single pass over the reservations
+
+main() in read_reservations.py calls five report functions and each of them
+loops over all reservations again. ReportAccumulator collects everything the
+five sections need while the file is read, one reservation at a time, and
+prints the sections afterwards in the original order. Sections that are not
+selected are not collected at all. When only the summary and the revenue
+are selected (--sections 4,5), only the duration, the price and the
+confirmation are converted; the names, dates and times are not parsed at all
+(see projected_loader.py).
+
+python report_engine.py [reservations.txt] [--sections 1,4,5] [--cache]
+                        [--format text|csv|json] [--output report.txt]
+                        [--stats stats.json] [--profile-stage convert]
+
+With --stats (or REPORT_STATS=stats.json) the time, rows and peak memory of
+the read, convert, aggregate and write stages are saved, see
+instrumentation.py.
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from read_reservations import (
+    convert_reservation_data,
+    format_confirmed,
+    format_iso_date,
+    format_iso_time,
+    format_long,
+    format_revenue,
+    format_status,
+    format_summary,
+)
+from projected_loader import line_projector
+from report_output import FORMATS, ReportWriter, open_output, write_report
+from reservation_cache import fetch_reservations_cached
+
+# The modules shared by Task E, F and G are in Tasks/Common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from instrumentation import add_arguments, counted, enable_from_args, stage, timed  # noqa: E402
+
+# Section key -> heading, in the order the sections are printed
+SECTIONS = {
+    "confirmed": "1) Confirmed Reservations",
+    "long": "2) Long Reservations (≥ 3 h)",
+    "statuses": "3) Reservation Confirmation Status",
+    "summary": "4) Confirmation Summary",
+    "revenue": "5) Total Revenue from Confirmed Reservations",
+}
+
+# Sections that keep the reservations to print them
+ROW_SECTIONS = {"confirmed", "long", "statuses"}
+
+# Fields ReportAccumulator.add() reads from every reservation
+ADD_FIELDS = ("durationHours", "price", "confirmed")
+
+
+def iter_reservations(reservation_file: str, fields: Iterable | None = None) -> Iterator[list]:
+    """
+    Reads reservations from a file one at a time
+
+    Unlike fetch_reservations() this does not build a list
+    and does not yield a header row.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     fields (Iterable): Fields to convert while reading, e.g. ADD_FIELDS.
+                        The other fields are converted when they are first
+                        read, see projected_loader.py. All fields by default.
+
+    Returns:
+     (Iterator[list]): Converted reservations
+    """
+    if fields is None:
+        convert = timed("convert", convert_reservation_data)
+        with open(reservation_file, "r", encoding="utf-8") as f:
+            for line in counted("read", f):
+                if len(line) > 1:
+                    yield convert(line.split("|"))
+        return
+
+    project = timed("convert", line_projector(fields))
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in counted("read", f):
+            if len(line) > 1:
+                yield project(line)
+
+
+def parse_sections(text: str) -> list[str]:
+    """
+    Converts a section selection such as "1,4,5" or "summary,revenue"
+    to section keys
+
+    Parameters:
+     text (str): Comma-separated section numbers or keys
+
+    Returns:
+     sections (list[str]): Selected section keys
+    """
+    keys = list(SECTIONS)
+    sections = []
+    for part in text.split(","):
+        part = part.strip()
+        if part.isdigit() and 1 <= int(part) <= len(keys):
+            sections.append(keys[int(part) - 1])
+        elif part in SECTIONS:
+            sections.append(part)
+        else:
+            raise ValueError(f"Unknown report section: {part}")
+    return sections
+
+
+class ReportAccumulator:
+    """
+    Collects the data of the selected report sections in one pass
+
+    Parameters:
+     sections (Iterable[str]): Section keys, all sections by default
+    """
+
+    def __init__(self, sections: Iterable[str] | None = None):
+        selected = set(SECTIONS) if sections is None else set(sections)
+        for section in selected:
+            if section not in SECTIONS:
+                raise ValueError(f"Unknown report section: {section}")
+        # Always printed in the original order
+        self.sections = [section for section in SECTIONS if section in selected]
+        self.confirmed_rows: list = []
+        self.long_rows: list = []
+        self.status_rows: list = []
+        self.total_count = 0
+        self.confirmed_count = 0
+        self.revenue = 0.0
+
+    def add(self, reservation: list) -> None:
+        """
+        Adds one reservation to every selected section
+
+        Parameters:
+         reservation (list): Converted reservation
+        """
+        confirmed = reservation[8]
+        self.total_count += 1
+        if confirmed:
+            self.confirmed_count += 1
+            self.revenue += reservation[6] * reservation[7]
+            if "confirmed" in self.sections:
+                self.confirmed_rows.append(reservation)
+        if "long" in self.sections and reservation[6] >= 3:
+            self.long_rows.append(reservation)
+        if "statuses" in self.sections:
+            self.status_rows.append(reservation)
+
+    def add_all(self, reservations: Iterable[list]) -> "ReportAccumulator":
+        """
+        Adds reservations from a list or a stream
+
+        Parameters:
+         reservations (Iterable[list]): Converted reservations, no header row
+
+        Returns:
+         self (ReportAccumulator): The same accumulator
+        """
+        for reservation in reservations:
+            self.add(reservation)
+        return self
+
+    def merge(self, other: "ReportAccumulator") -> None:
+        """
+        Appends the results of another accumulator that collected
+        the reservations following these ones
+
+        Parameters:
+         other (ReportAccumulator): Accumulator with the same sections
+        """
+        self.confirmed_rows.extend(other.confirmed_rows)
+        self.long_rows.extend(other.long_rows)
+        self.status_rows.extend(other.status_rows)
+        self.total_count += other.total_count
+        self.confirmed_count += other.confirmed_count
+        self.revenue += other.revenue
+
+    def section_lines(self, section: str) -> Iterator[str]:
+        """
+        Returns the lines of one section without its heading
+
+        Parameters:
+         section (str): Section key
+        """
+        if section == "confirmed":
+            for reservation in self.confirmed_rows:
+                yield format_confirmed(reservation)
+        elif section == "long":
+            for reservation in self.long_rows:
+                yield format_long(reservation)
+        elif section == "statuses":
+            for reservation in self.status_rows:
+                yield format_status(reservation)
+        elif section == "summary":
+            yield format_summary(self.confirmed_count, self.total_count - self.confirmed_count)
+        elif section == "revenue":
+            yield format_revenue(self.revenue)
+
+    def section_rows(self, section: str) -> Iterator[tuple]:
+        """
+        Returns the rows of one section as tuples for CSV and JSON output,
+        with the values in the order of SECTION_FIELDS in report_output.py
+
+        Parameters:
+         section (str): Section key
+        """
+        if section in ("confirmed", "long", "statuses"):
+            rows = {"confirmed": self.confirmed_rows, "long": self.long_rows, "statuses": self.status_rows}[section]
+            for reservation in rows:
+                yield (
+                    reservation[0],
+                    reservation[1],
+                    format_iso_date(reservation[4]),
+                    format_iso_time(reservation[5]),
+                    reservation[6],
+                    reservation[8],
+                    reservation[9],
+                )
+        elif section == "summary":
+            yield (self.confirmed_count, self.total_count - self.confirmed_count)
+        elif section == "revenue":
+            yield (round(self.revenue, 2),)
+
+    def lines(self) -> Iterator[str]:
+        """Returns the headings and lines of all selected sections in order"""
+        for section in self.sections:
+            yield SECTIONS[section]
+            yield from self.section_lines(section)
+
+    def print_report(self) -> None:
+        """Prints the selected sections to the console"""
+        for line in self.lines():
+            print(line)
+
+
+def build_report(reservations: Iterable[list], sections: Iterable[str] | None = None) -> ReportAccumulator:
+    """
+    Collects the selected report sections from reservations in one pass
+
+    Parameters:
+     reservations (Iterable[list]): Converted reservations, no header row
+     sections (Iterable[str]): Section keys, all sections by default
+
+    Returns:
+     report (ReportAccumulator): Collected report
+    """
+    return ReportAccumulator(sections).add_all(reservations)
+
+
+def main():
+    """
+    Reads the reservations once and prints the selected report sections
+    """
+    parser = argparse.ArgumentParser(description="Print reservation reports in one pass")
+    parser.add_argument("file", nargs="?", default="reservations.txt", help="reservation file")
+    parser.add_argument(
+        "--sections",
+        type=parse_sections,
+        default=None,
+        help="sections to print, e.g. 1,4,5 or summary,revenue (default: all)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="load the reservations from a cache file next to the reservation file",
+    )
+    parser.add_argument("--format", choices=FORMATS, default="text", help="output format (default: text)")
+    parser.add_argument("--output", default=None, help="output file (default: stdout)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(args)
+
+    if args.cache:
+        with stage("read_cache") as measured:
+            cached = fetch_reservations_cached(args.file)
+            measured.rows = len(cached) - 1
+        reservations = islice(cached, 1, None)
+    else:
+        sections = SECTIONS if args.sections is None else args.sections
+        # Sections that keep reservations read most of their fields anyway
+        keeps_rows = not ROW_SECTIONS.isdisjoint(sections)
+        reservations = iter_reservations(args.file, None if keeps_rows else ADD_FIELDS)
+    with stage("aggregate") as measured:
+        report = build_report(reservations, args.sections)
+        measured.rows = report.total_count
+
+    with stage("write") as measured:
+        stream = open_output(args.output)
+        try:
+            with ReportWriter(stream, args.format) as writer:
+                write_report(report, writer)
+            measured.rows = writer.rows
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Writes reservation reports as text, CSV or JSON lines with buffered output
+
+print() writes to the terminal once per reservation. ReportWriter collects
+the output in memory and writes it in large batches instead, to stdout or
+to a file.
+
+text -> the same lines as read_reservations.py prints
+csv  -> one row per reservation or total, with a section column
+json -> one JSON object per line, with a section key
+"""
+
+import csv
+import json
+import sys
+from collections.abc import Iterable
+from itertools import islice
+from json.encoder import encode_basestring
+from typing import TextIO
+
+FORMATS = ["text", "csv", "json"]
+
+RESERVATION_FIELDS = [
+    "reservationId",
+    "name",
+    "reservationDate",
+    "reservationTime",
+    "durationHours",
+    "confirmed",
+    "reservedResource",
+]
+
+# Order of the values in the rows of each section
+SECTION_FIELDS = {
+    "confirmed": RESERVATION_FIELDS,
+    "long": RESERVATION_FIELDS,
+    "statuses": RESERVATION_FIELDS,
+    "summary": ["confirmedCount", "notConfirmedCount"],
+    "revenue": ["revenue"],
+}
+
+CSV_FIELDS = ["section", *RESERVATION_FIELDS, "confirmedCount", "notConfirmedCount", "revenue"]
+
+
+def json_column(values: tuple, encode) -> list[str]:
+    """
+    Encodes the values of one column as JSON
+
+    Strings are encoded one by one with encode_basestring(). Numbers,
+    booleans and None never contain ", ", so a column of them is encoded
+    as one array and split into its values.
+
+    Parameters:
+     values (tuple): Values of the column
+     encode (Callable): encode() of a JSONEncoder
+
+    Returns:
+     encoded (list[str]): JSON text of each value
+    """
+    if all(value.__class__ is str for value in values):
+        return list(map(encode_basestring, values))
+    if all(value is None or isinstance(value, (int, float)) for value in values):
+        return encode(values)[1:-1].split(", ")
+    return list(map(encode, values))
+
+
+class ReportWriter:
+    """
+    Buffered writer for report output
+
+    Parameters:
+     stream (TextIO): Where the output goes, e.g. sys.stdout or an open file
+     output_format (str): text, csv or json
+     batch_size (int): Number of pieces collected before they are written
+    """
+
+    def __init__(self, stream: TextIO, output_format: str = "text", batch_size: int = 4096):
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        self.stream = stream
+        self.output_format = output_format
+        self.batch_size = batch_size
+        self.pending: list[str] = []
+        self.rows = 0  # Lines, CSV rows or JSON lines written, without the CSV header
+        self.csv_writer = None
+        self.json_encoder = json.JSONEncoder(ensure_ascii=False)
+        if output_format == "csv":
+            # csv.writer calls self.write(), so CSV rows are buffered too
+            self.csv_writer = csv.writer(self, lineterminator="\n")
+            self.csv_writer.writerow(CSV_FIELDS)
+
+    def write(self, text: str) -> None:
+        """
+        Adds text to the buffer and writes the buffer when it is full
+
+        Parameters:
+         text (str): Text to write
+        """
+        self.pending.append(text)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes everything in the buffer to the stream"""
+        if self.pending:
+            self.stream.write("".join(self.pending))
+            self.pending.clear()
+        self.stream.flush()
+
+    def line(self, text: str) -> None:
+        """
+        Writes one line of text output
+
+        Parameters:
+         text (str): Line without a line break
+        """
+        self.write(text + "\n")
+        self.rows += 1
+
+    def records(self, section: str, rows: Iterable[tuple]) -> None:
+        """
+        Writes the rows of one section as CSV rows or JSON lines
+
+        The rows are written batch_size rows at a time: a CSV batch is
+        padded to the columns of CSV_FIELDS and written with one
+        writerows() call, and a JSON batch is encoded one column at a time
+        with json_column().
+
+        Parameters:
+         section (str): Section key
+         rows (Iterable[tuple]): Values in the order of SECTION_FIELDS[section]
+        """
+        fields = SECTION_FIELDS[section]
+        rows = iter(rows)
+        if self.csv_writer is not None:
+            first = CSV_FIELDS.index(fields[0])
+            before = (section,) + ("",) * (first - 1)
+            after = ("",) * (len(CSV_FIELDS) - first - len(fields))
+            while batch := list(islice(rows, self.batch_size)):
+                self.csv_writer.writerows([before + row + after for row in batch])
+                self.rows += len(batch)
+        else:
+            keys = ["section", *fields]
+            template = "{" + ", ".join(f"{encode_basestring(key)}: %s" for key in keys) + "}\n"
+            encode = self.json_encoder.encode
+            while batch := list(islice(rows, self.batch_size)):
+                columns = [json_column(values, encode) for values in zip(*batch)]
+                sections = [encode_basestring(section)] * len(batch)
+                self.write("".join([template % values for values in zip(sections, *columns)]))
+                self.rows += len(batch)
+
+    def close(self) -> None:
+        """Writes the rest of the buffer"""
+        self.flush()
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_report(report, writer: ReportWriter) -> None:
+    """
+    Writes a collected report in the format of the writer
+
+    Parameters:
+     report (ReportAccumulator): Collected report
+     writer (ReportWriter): Where to write
+    """
+    if writer.output_format == "text":
+        for text in report.lines():
+            writer.line(text)
+        return
+    for section in report.sections:
+        writer.records(section, report.section_rows(section))
+
+
+def open_output(filename: str | None) -> TextIO:
+    """
+    Opens the output file, or returns stdout if no file is given
+
+    Parameters:
+     filename (str): Name of the output file, "-" or None for stdout
+    """
+    if filename is None or filename == "-":
+        return sys.stdout
+    return open(filename, "w", encoding="utf-8", newline="")
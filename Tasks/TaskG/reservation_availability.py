@@ -0,0 +1,247 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Finds free times of the reserved resources with bitmaps
+
+The day is divided into slots of an hour (or a quarter of an hour), and
+for every resource and day one integer is kept where bit i is set if slot
+i is booked. A reservation sets the bits of the slots it touches, so a
+reservation from 09.15 to 10.15 books the slots 9 and 10 when the slots are
+hours. A reservation that continues past midnight books slots of the next
+day too.
+
+"Is Red Room free on 12.11.2025 from 09.00 for 3 hours" is then one AND
+of the bitmap with a mask of the three slots, and the first free time of
+a day is found with a few shifts and ANDs instead of looking at every
+reservation:
+
+python reservation_availability.py [reservations.txt] --date 2025-11-12 --time 09:00 --hours 3
+                                   [--resource "Red Room"] [--slot 60|15]
+"""
+
+import argparse
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+
+from read_reservations import HEADERS, fetch_reservations, format_date, parse_date, parse_time
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class AvailabilityIndex:
+    """
+    Booked slots of every resource and day
+
+    Parameters:
+     reservations (Iterable[list]): Reservations, with or without the header row
+     slot_minutes (int): Length of a slot, 60 or 15 for example
+     confirmed_only (bool): Only confirmed reservations book slots
+     resources (Iterable[str]): Resources that may have no reservations yet
+    """
+
+    def __init__(
+        self,
+        reservations: Iterable[list] = (),
+        slot_minutes: int = 60,
+        confirmed_only: bool = False,
+        resources: Iterable[str] = (),
+    ):
+        if slot_minutes <= 0 or MINUTES_PER_DAY % slot_minutes:
+            raise ValueError("The slot length must divide the day evenly, e.g. 60 or 15 minutes")
+        self.slot_minutes = slot_minutes
+        self.slots_per_day = MINUTES_PER_DAY // slot_minutes
+        self.full_day = (1 << self.slots_per_day) - 1
+        self.confirmed_only = confirmed_only
+        self.resources: set[str] = set(resources)
+        # resource -> day -> bitmap of booked slots
+        self.bitmaps: dict[str, dict[date, int]] = {}
+        # (resource, day) -> reservationId -> mask, for cancelling
+        self.day_masks: dict[tuple[str, date], dict[int, int]] = {}
+        # reservationId -> (resource, days it books)
+        self.bookings: dict[int, tuple[str, list[date]]] = {}
+        for reservation in reservations:
+            if reservation != HEADERS:
+                self.add(reservation)
+
+    def slot_masks(self, day: date, start: time, minutes: int) -> list[tuple[date, int]]:
+        """
+        Returns the slots touched by a time period, one mask per day
+
+        Parameters:
+         day (date): Day the period starts
+         start (time): Start time
+         minutes (int): Length of the period
+
+        Returns:
+         masks (list[tuple[date, int]]): (day, bits of the slots) in date order
+        """
+        first = (start.hour * 60 + start.minute) // self.slot_minutes
+        # The slot of the last minute of the period is the last slot touched
+        last = (start.hour * 60 + start.minute + max(minutes, 1) - 1) // self.slot_minutes
+        masks = []
+        while first <= last:
+            end = min(last, self.slots_per_day - 1)
+            masks.append((day, ((1 << (end - first + 1)) - 1) << first))
+            day += timedelta(days=1)
+            first, last = 0, last - self.slots_per_day
+        return masks
+
+    def add(self, reservation: list) -> None:
+        """
+        Books the slots of a reservation, replacing an earlier
+        reservation with the same reservationId
+
+        Parameters:
+         reservation (list): Converted reservation
+        """
+        self.cancel(reservation[0])
+        self.resources.add(reservation[9])
+        if self.confirmed_only and not reservation[8]:
+            return
+        masks = self.slot_masks(reservation[4], reservation[5], reservation[6] * 60)
+        days = self.bitmaps.setdefault(reservation[9], {})
+        for day, mask in masks:
+            days[day] = days.get(day, 0) | mask
+            self.day_masks.setdefault((reservation[9], day), {})[reservation[0]] = mask
+        self.bookings[reservation[0]] = (reservation[9], [day for day, _ in masks])
+
+    def cancel(self, reservation_id: int) -> None:
+        """
+        Frees the slots of a reservation
+
+        A slot stays booked if another reservation of the same resource
+        also books it, so the bitmap of each day of the reservation is
+        built again from the other reservations of that day.
+
+        Parameters:
+         reservation_id (int): reservationId of the reservation
+        """
+        booking = self.bookings.pop(reservation_id, None)
+        if booking is None:
+            return
+        resource, days = booking
+        bitmaps = self.bitmaps[resource]
+        for day in days:
+            masks = self.day_masks[resource, day]
+            del masks[reservation_id]
+            bitmap = 0
+            for mask in masks.values():
+                bitmap |= mask
+            if bitmap:
+                bitmaps[day] = bitmap
+            else:
+                del bitmaps[day]
+                del self.day_masks[resource, day]
+
+    def booked(self, resource: str, day: date) -> int:
+        """Returns the bitmap of the booked slots of a resource on a day"""
+        return self.bitmaps.get(resource, {}).get(day, 0)
+
+    def is_free(self, resource: str, day: date, start: time, hours: float) -> bool:
+        """
+        Tells if a resource has no reservations during a time period
+
+        Parameters:
+         resource (str): reservedResource
+         day (date): Day the period starts
+         start (time): Start time
+         hours (float): Length of the period
+        """
+        masks = self.slot_masks(day, start, round(hours * 60))
+        return all(not self.booked(resource, mask_day) & mask for mask_day, mask in masks)
+
+    def free_resources(self, day: date, start: time, hours: float) -> list[str]:
+        """
+        Returns the resources that are free during a time period, in alphabetical order
+
+        Parameters:
+         day (date): Day the period starts
+         start (time): Start time
+         hours (float): Length of the period
+        """
+        return [resource for resource in sorted(self.resources) if self.is_free(resource, day, start, hours)]
+
+    def free_starts(self, resource: str, day: date, slots: int) -> int:
+        """
+        Returns a bitmap where bit i is set if slots i, i + 1, ..., i + slots - 1
+        are all free on the day
+
+        The free runs are found by ANDing the free bitmap with itself shifted
+        by 1, 2, 4, ... slots, so a run of n slots takes about log2(n) steps.
+        Periods that continue to the next day are not included.
+        """
+        starts = ~self.booked(resource, day) & self.full_day
+        covered = 1
+        while covered < slots and starts:
+            step = min(covered, slots - covered)
+            starts &= starts >> step
+            covered += step
+        return starts
+
+    def first_free(
+        self,
+        resource: str,
+        day: date,
+        hours: float,
+        earliest: time = time(0),
+        latest_end: time | None = None,
+    ) -> datetime | None:
+        """
+        Returns the first time a resource is free for a whole period
+
+        Parameters:
+         resource (str): reservedResource
+         day (date): Day to search
+         hours (float): Length of the period
+         earliest (time): The period may not start before this
+         latest_end (time | None): The period must end by this, midnight by default
+
+        Returns:
+         (datetime | None): Start of the first free period, or None if the
+         period does not fit in the day
+        """
+        slots = -(-round(hours * 60) // self.slot_minutes)
+        first = -(-(earliest.hour * 60 + earliest.minute) // self.slot_minutes)
+        end = self.slots_per_day if latest_end is None else (latest_end.hour * 60 + latest_end.minute) // self.slot_minutes
+        if slots <= 0 or first + slots > end:
+            return None
+        # Keep the starts from which the whole period ends by the end slot
+        starts = self.free_starts(resource, day, slots) >> first << first
+        starts &= (1 << (end - slots + 1)) - 1
+        if not starts:
+            return None
+        slot = (starts & -starts).bit_length() - 1
+        return datetime.combine(day, time()) + timedelta(minutes=slot * self.slot_minutes)
+
+
+def main():
+    """Prints which resources are free at a time and the first free time of each"""
+    parser = argparse.ArgumentParser(description="Find free resources")
+    parser.add_argument("file", nargs="?", default="reservations.txt", help="reservation file")
+    parser.add_argument("--date", type=parse_date, required=True, help="day, e.g. 2025-11-12")
+    parser.add_argument("--time", type=parse_time, default=time(8), help="start time, e.g. 09:00 (default: 08:00)")
+    parser.add_argument("--hours", type=float, default=1, help="length in hours (default: 1)")
+    parser.add_argument("--resource", default=None, help="only this resource")
+    parser.add_argument("--slot", type=int, default=60, help="slot length in minutes (default: 60)")
+    args = parser.parse_args()
+
+    index = AvailabilityIndex(fetch_reservations(args.file), args.slot)
+    resources = [args.resource] if args.resource else sorted(index.resources)
+    print(f"{format_date(args.date)} at {args.time:%H.%M} for {args.hours:g} h:")
+    for resource in resources:
+        if index.is_free(resource, args.date, args.time, args.hours):
+            print(f"- {resource}: free")
+            continue
+        first = index.first_free(resource, args.date, args.hours, args.time)
+        later = f"free at {first:%H.%M}" if first else "not free later that day"
+        print(f"- {resource}: booked, {later}")
+
+
+if __name__ == "__main__":
+    main()
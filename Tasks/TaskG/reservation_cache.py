@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Keeps the converted reservations in a binary file next to the text file
+
+The first run parses reservations.txt as usual and saves the result to
+reservations.txt.cache. The cache remembers the path, size and modification
+time of the text file, and later runs load the cache instead of parsing
+the text again as long as those match. If the text file changes, the cache
+is rebuilt automatically.
+
+python reservation_cache.py [reservations.txt]
+"""
+
+import os
+import pickle
+import sys
+import time
+
+from read_reservations import fetch_reservations
+
+CACHE_VERSION = 1
+
+
+def cache_file_for(reservation_file: str) -> str:
+    """
+    Returns the name of the cache file of a reservation file
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+    """
+    return reservation_file + ".cache"
+
+
+def source_key(reservation_file: str) -> tuple[str, int, int]:
+    """
+    Returns what identifies one version of a reservation file
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+
+    Returns:
+     (path, size, mtime): Absolute path, size in bytes and modification time in ns
+    """
+    stat = os.stat(reservation_file)
+    return os.path.abspath(reservation_file), stat.st_size, stat.st_mtime_ns
+
+
+def load_cache(cache_file: str, key: tuple[str, int, int]) -> list[list] | None:
+    """
+    Loads reservations from a cache file
+
+    Parameters:
+     cache_file (str): Name of the cache file
+     key (tuple): source_key() of the reservation file
+
+    Returns:
+     reservations (list | None): Cached reservations, or None if the cache
+     is missing, damaged or belongs to another version of the file
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            version, cached_key, reservations = pickle.load(f)
+    except Exception:
+        # A damaged pickle can raise almost any error, the file is then parsed again
+        return None
+    if version != CACHE_VERSION or tuple(cached_key) != key:
+        return None
+    return reservations
+
+
+def save_cache(cache_file: str, key: tuple[str, int, int], reservations: list[list]) -> None:
+    """
+    Saves reservations to a cache file
+
+    The data is written to a temporary file first, so a crash never
+    leaves a half-written cache behind.
+
+    Parameters:
+     cache_file (str): Name of the cache file
+     key (tuple): source_key() of the reservation file
+     reservations (list): Reservations from fetch_reservations()
+    """
+    temporary_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file, "wb") as f:
+            pickle.dump((CACHE_VERSION, key, reservations), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, cache_file)
+    except BaseException:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+        raise
+
+
+def fetch_reservations_cached(reservation_file: str, cache_file: str | None = None) -> list[list]:
+    """
+    Returns the same as fetch_reservations(), but uses the cache file
+    when it matches the reservation file
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     cache_file (str): Name of the cache file, by default reservation_file + ".cache"
+
+    Returns:
+     reservations (list): Header row and converted reservations
+    """
+    cache_file = cache_file or cache_file_for(reservation_file)
+    key = source_key(reservation_file)
+    reservations = load_cache(cache_file, key)
+    if reservations is None:
+        reservations = fetch_reservations(reservation_file)
+        try:
+            save_cache(cache_file, key, reservations)
+        except OSError as e:
+            print(f"Could not write the cache file {cache_file}: {e}", file=sys.stderr)
+    return reservations
+
+
+def main():
+    """
+    Prints the load time without a cache (cold) and with a cache (warm)
+    """
+    reservation_file = sys.argv[1] if len(sys.argv) > 1 else "reservations.txt"
+    cache_file = cache_file_for(reservation_file)
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
+
+    started = time.perf_counter()
+    cold = fetch_reservations_cached(reservation_file)
+    cold_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    warm = fetch_reservations_cached(reservation_file)
+    warm_time = time.perf_counter() - started
+
+    if cold != warm:
+        raise AssertionError("cached reservations differ from the parsed ones")
+
+    print(f"Reservations: {len(cold) - 1}")
+    print(f"- cold load (parse and write cache): {cold_time:.3f} s")
+    print(f"- warm load (read cache): {warm_time:.3f} s")
+    print(f"- cache file: {cache_file} ({os.path.getsize(cache_file) / 1024 / 1024:.2f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Finds double bookings: confirmed reservations of the same resource
+whose times overlap
+
+Comparing every reservation of a resource with every other one takes
+O(n²) time. Instead the reservations of each resource are sorted by start
+time and swept in that order. The reservations that have started but not
+yet ended are kept in a list in start order. When a reservation starts,
+the ones that ended at or before its start are dropped from the list, and
+every reservation left in it overlaps the new one. Each reservation is
+dropped once and every other one kept is a reported pair, so the sweep
+takes O(n log n + k) time, where k is the number of overlapping pairs.
+
+A reservation that ends at 11.00 does not overlap one that starts at 11.00.
+
+python reservation_conflicts.py [reservations.txt] [--all] [--output conflicts.txt]
+"""
+
+import argparse
+import sys
+from collections.abc import Iterable, Iterator
+
+from read_reservations import HEADERS, fetch_reservations, format_date, format_time
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def reservation_minutes(reservation: list) -> tuple[int, int]:
+    """
+    Returns the start and end of a reservation in minutes
+
+    Counting minutes from the start of the calendar keeps the sweep on
+    integers, which is much faster than comparing datetime objects.
+
+    Parameters:
+     reservation (list): Converted reservation
+
+    Returns:
+     (tuple[int, int]): Start and end, the end is not included
+    """
+    start_time = reservation[5]
+    start = reservation[4].toordinal() * MINUTES_PER_DAY + start_time.hour * 60 + start_time.minute
+    return start, start + reservation[6] * 60
+
+
+def group_by_resource(reservations: Iterable[list], confirmed_only: bool = True) -> dict[str, list]:
+    """
+    Collects the reservations of each resource with their times
+
+    Parameters:
+     reservations (Iterable[list]): Reservations, with or without the header row
+     confirmed_only (bool): Leave out reservations that are not confirmed
+
+    Returns:
+     resources (dict[str, list]): reservedResource -> [(start, end, reservation)]
+    """
+    resources: dict[str, list] = {}
+    for reservation in reservations:
+        if reservation == HEADERS or (confirmed_only and not reservation[8]):
+            continue
+        start, end = reservation_minutes(reservation)
+        resources.setdefault(reservation[9], []).append((start, end, reservation))
+    return resources
+
+
+def sweep_conflicts(spans: list) -> Iterator[tuple[list, list]]:
+    """
+    Finds the overlapping pairs among the reservations of one resource
+
+    Parameters:
+     spans (list): (start, end, reservation) tuples in any order
+
+    Returns:
+     (Iterator[tuple[list, list]]): Pairs (earlier, later) in order of the
+     start of the later reservation
+    """
+    spans = sorted(spans, key=lambda span: span[0])
+    active: list[tuple[int, list]] = []  # (end, reservation) in start order
+    for start, end, reservation in spans:
+        active = [item for item in active if item[0] > start]
+        for _, other in active:
+            yield other, reservation
+        active.append((end, reservation))
+
+
+def iter_conflicts(reservations: Iterable[list], confirmed_only: bool = True) -> Iterator[tuple[str, list, list]]:
+    """
+    Finds every pair of overlapping reservations of the same resource
+
+    Parameters:
+     reservations (Iterable[list]): Reservations, with or without the header row
+     confirmed_only (bool): Only check confirmed reservations
+
+    Returns:
+     (Iterator[tuple[str, list, list]]): (reservedResource, earlier, later),
+     resources in alphabetical order
+    """
+    resources = group_by_resource(reservations, confirmed_only)
+    for resource in sorted(resources):
+        for first, second in sweep_conflicts(resources[resource]):
+            yield resource, first, second
+
+
+def naive_conflicts(reservations: Iterable[list], confirmed_only: bool = True) -> set[tuple[int, int]]:
+    """
+    Finds the same pairs by comparing every two reservations, for testing
+
+    Returns:
+     pairs (set[tuple[int, int]]): reservationIds of the overlapping pairs, smaller id first
+    """
+    pairs = set()
+    for spans in group_by_resource(reservations, confirmed_only).values():
+        for i, (start, end, reservation) in enumerate(spans):
+            for other_start, other_end, other in spans[i + 1:]:
+                if start < other_end and other_start < end:
+                    pairs.add((min(reservation[0], other[0]), max(reservation[0], other[0])))
+    return pairs
+
+
+def format_span(reservation: list) -> str:
+    """Formats the name, date and time of a reservation, e.g. Anna, 12.11.2025 at 09.00 (3 h)"""
+    return f"{reservation[1]}, {format_date(reservation[4])} at {format_time(reservation[5])} ({reservation[6]} h)"
+
+
+def format_conflict(resource: str, first: list, second: list) -> str:
+    """
+    Formats one row of the double booking report
+
+    Parameters:
+     resource (str): reservedResource
+     first (list): The reservation that starts first
+     second (list): The reservation that overlaps it
+    """
+    return f"- {resource}: #{first[0]} {format_span(first)} overlaps #{second[0]} {format_span(second)}"
+
+
+def conflict_report(reservations: Iterable[list], confirmed_only: bool = True) -> list[str]:
+    """
+    Builds the double booking report
+
+    Parameters:
+     reservations (Iterable[list]): Reservations, with or without the header row
+     confirmed_only (bool): Only check confirmed reservations
+
+    Returns:
+     lines (list[str]): Report lines
+    """
+    lines = ["Double bookings" + (" (confirmed reservations)" if confirmed_only else " (all reservations)")]
+    lines.extend(format_conflict(*conflict) for conflict in iter_conflicts(reservations, confirmed_only))
+    if len(lines) == 1:
+        lines.append("- No overlapping reservations")
+    return lines
+
+
+def main():
+    """Prints or writes the double booking report"""
+    parser = argparse.ArgumentParser(description="Find overlapping reservations of the same resource")
+    parser.add_argument("file", nargs="?", default="reservations.txt", help="reservation file")
+    parser.add_argument("--all", action="store_true", help="check also reservations that are not confirmed")
+    parser.add_argument("--output", default=None, help="report file (default: stdout)")
+    args = parser.parse_args()
+
+    lines = conflict_report(fetch_reservations(args.file), not args.all)
+    if args.output is None:
+        for line in lines:
+            print(line)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.writelines(line + "\n" for line in lines)
+        print(f"The report was written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Indexes for finding reservations without looping over all of them
+
+ReservationIndex is built once from the result of fetch_reservations() and
+keeps three indexes:
+
+reservationId    -> dict, one lookup per query
+reservedResource -> dict of reservations sorted by date
+reservationDate  -> sorted list searched with bisect
+
+python reservation_index.py [reservations.txt]
+"""
+
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from read_reservations import HEADERS, fetch_reservations
+
+
+class DateIndex:
+    """
+    Reservations kept in order of reservationDate, so that all
+    reservations between two dates can be found with bisect
+    """
+
+    def __init__(self):
+        self.dates: list[date] = []
+        self.reservations: list = []
+
+    def add(self, reservation: list) -> None:
+        """
+        Adds one reservation after any reservations on the same date
+
+        Parameters:
+         reservation (list): Converted reservation
+        """
+        position = bisect_right(self.dates, reservation[4])
+        self.dates.insert(position, reservation[4])
+        self.reservations.insert(position, reservation)
+
+    def remove(self, reservation: list) -> None:
+        """
+        Removes one reservation
+
+        Parameters:
+         reservation (list): Reservation that was added earlier
+        """
+        start = bisect_left(self.dates, reservation[4])
+        end = bisect_right(self.dates, reservation[4])
+        for position in range(start, end):
+            if self.reservations[position] is reservation:
+                del self.dates[position]
+                del self.reservations[position]
+                return
+
+    def between(self, start: date, end: date) -> list:
+        """
+        Returns the reservations from start to end, both dates included
+
+        Parameters:
+         start (date): First date
+         end (date): Last date
+        """
+        return self.reservations[bisect_left(self.dates, start):bisect_right(self.dates, end)]
+
+
+class ReservationIndex:
+    """
+    Hash and sorted indexes over reservations
+
+    Parameters:
+     reservations (Iterable[list]): Reservations, with or without the header row
+    """
+
+    def __init__(self, reservations: Iterable[list] = ()):
+        self.by_id: dict[int, list] = {}
+        self.by_resource: dict[str, DateIndex] = {}
+        self.by_date = DateIndex()
+
+        # A later reservation with the same reservationId replaces the earlier
+        # one and moves after it, as with add()
+        for reservation in reservations:
+            if reservation != HEADERS:
+                self.by_id.pop(reservation[0], None)
+                self.by_id[reservation[0]] = reservation
+
+        # Sorting once is faster than inserting the rows one by one
+        for reservation in sorted(self.by_id.values(), key=lambda reservation: reservation[4]):
+            resource_index = self.by_resource.setdefault(reservation[9], DateIndex())
+            resource_index.dates.append(reservation[4])
+            resource_index.reservations.append(reservation)
+            self.by_date.dates.append(reservation[4])
+            self.by_date.reservations.append(reservation)
+
+    def add(self, reservation: list) -> None:
+        """
+        Adds a new reservation to all indexes
+
+        Parameters:
+         reservation (list): Converted reservation
+        """
+        self.remove(reservation[0])
+        self.by_id[reservation[0]] = reservation
+        self.by_resource.setdefault(reservation[9], DateIndex()).add(reservation)
+        self.by_date.add(reservation)
+
+    def remove(self, reservation_id: int) -> None:
+        """
+        Removes a reservation from all indexes
+
+        Parameters:
+         reservation_id (int): reservationId of the reservation
+        """
+        reservation = self.by_id.pop(reservation_id, None)
+        if reservation is not None:
+            self.by_resource[reservation[9]].remove(reservation)
+            self.by_date.remove(reservation)
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+
+def find_by_id(index: ReservationIndex, reservation_id: int) -> list | None:
+    """
+    Returns the reservation with the given id, or None
+
+    Parameters:
+     index (ReservationIndex): Reservation indexes
+     reservation_id (int): reservationId to look up
+    """
+    return index.by_id.get(reservation_id)
+
+
+def find_by_resource(index: ReservationIndex, resource: str) -> list[list]:
+    """
+    Returns all reservations of one resource in date order
+
+    Parameters:
+     index (ReservationIndex): Reservation indexes
+     resource (str): reservedResource, e.g. Red Room
+    """
+    resource_index = index.by_resource.get(resource)
+    return list(resource_index.reservations) if resource_index else []
+
+
+def find_by_date_range(index: ReservationIndex, start: date, end: date) -> list[list]:
+    """
+    Returns the reservations from start to end (inclusive) in date order
+
+    Parameters:
+     index (ReservationIndex): Reservation indexes
+     start (date): First date
+     end (date): Last date
+    """
+    return index.by_date.between(start, end)
+
+
+def find_by_resource_and_date_range(index: ReservationIndex, resource: str, start: date, end: date) -> list[list]:
+    """
+    Returns the reservations of one resource from start to end (inclusive)
+
+    Parameters:
+     index (ReservationIndex): Reservation indexes
+     resource (str): reservedResource, e.g. Red Room
+     start (date): First date
+     end (date): Last date
+    """
+    resource_index = index.by_resource.get(resource)
+    return resource_index.between(start, end) if resource_index else []
+
+
+def main():
+    """
+    Answers a few example questions with the indexes and with
+    a linear scan and prints the times
+    """
+    reservation_file = sys.argv[1] if len(sys.argv) > 1 else "reservations.txt"
+    reservations = fetch_reservations(reservation_file)
+
+    started = time.perf_counter()
+    index = ReservationIndex(reservations)
+    build_time = time.perf_counter() - started
+
+    start = date(2025, 10, 20)
+    end = start + timedelta(days=6)
+
+    started = time.perf_counter()
+    scanned = [x for x in reservations[1:] if x[9] == "Red Room" and start <= x[4] <= end]
+    by_id_scan = next((x for x in reservations[1:] if x[0] == 203), None)
+    scan_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    found = find_by_resource_and_date_range(index, "Red Room", start, end)
+    by_id = find_by_id(index, 203)
+    index_time = time.perf_counter() - started
+
+    if sorted(map(id, scanned)) != sorted(map(id, found)) or by_id is not by_id_scan:
+        raise AssertionError("index gave different results than a linear scan")
+
+    print(f"Red Room {start.strftime('%d.%m.%Y')}–{end.strftime('%d.%m.%Y')}:")
+    for reservation in found:
+        print(f'- {reservation[1]}, {reservation[4].strftime("%d.%m.%Y")} at {reservation[5].strftime("%H.%M")}')
+    print(f"Reservation 203: {by_id[1] if by_id else 'not found'}")
+    print(f"Reservations: {len(index)}")
+    print(f"- building the indexes: {build_time * 1000:.2f} ms")
+    print(f"- linear scan: {scan_time * 1000:.3f} ms")
+    print(f"- index lookup: {index_time * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Keeps the reservations in an SQLite database and computes the reports
+with SQL queries
+
+reservations.txt is imported into reservations.txt.db once, in a single
+transaction with executemany(), and indexes are created on reservationDate,
+reservedResource and confirmed. Like the cache of reservation_cache.py,
+the database remembers the path, size and modification time of the text
+file and is imported again when the file changes.
+
+The five reports of read_reservations.py are then answered by the database:
+the filtering, counting and summing is done by SQLite, and only the rows
+that are printed are returned to Python. The output is the same as that of
+report_engine.py, in text, CSV or JSON:
+
+python reservation_sqlite.py [reservations.txt] [--database reservations.db]
+                             [--sections 1,4,5] [--format text|csv|json] [--output report.txt]
+
+sqlite3 ships with Python, so no other packages or services are needed.
+"""
+
+import argparse
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator
+from datetime import date
+
+from read_reservations import convert_reservation_data, format_revenue, format_summary
+from report_engine import SECTIONS, parse_sections
+from report_output import FORMATS, ReportWriter, open_output, write_report
+from reservation_cache import source_key
+
+DATABASE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reservations (
+    reservationId INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    reservationDate TEXT NOT NULL,  -- YYYY-MM-DD
+    reservationTime TEXT NOT NULL,  -- HH:MM
+    durationHours INTEGER NOT NULL,
+    price REAL NOT NULL,
+    confirmed INTEGER NOT NULL,     -- 1 or 0
+    reservedResource TEXT NOT NULL,
+    createdAt TEXT NOT NULL         -- YYYY-MM-DD HH:MM:SS
+);
+CREATE TABLE IF NOT EXISTS source (
+    version INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL
+);
+"""
+
+# Created after the rows are imported, which is faster than updating them row by row
+INDEXES = {
+    "reservations_date": "reservationDate",
+    "reservations_resource": "reservedResource",
+    "reservations_confirmed": "confirmed",
+}
+
+# The rows are returned in the order of the file, like the other report functions
+ROW_COLUMNS = "reservationId, name, reservationDate, reservationTime, durationHours, confirmed, reservedResource"
+ROW_QUERIES = {
+    "confirmed": f"SELECT {ROW_COLUMNS} FROM reservations WHERE confirmed = 1 ORDER BY rowid",
+    "long": f"SELECT {ROW_COLUMNS} FROM reservations WHERE durationHours >= 3 ORDER BY rowid",
+    "statuses": f"SELECT {ROW_COLUMNS} FROM reservations ORDER BY rowid",
+}
+
+# Columns that are formatted in SQL for the text lines of each section
+LINE_QUERIES = {
+    "confirmed": (
+        "SELECT '- ' || name || ', ' || reservedResource || ', ' || strftime('%d.%m.%Y', reservationDate)"
+        " || ' at ' || replace(reservationTime, ':', '.')"
+        " FROM reservations WHERE confirmed = 1 ORDER BY rowid"
+    ),
+    "long": (
+        "SELECT '- ' || name || ', ' || strftime('%d.%m.%Y', reservationDate)"
+        " || ' at ' || replace(reservationTime, ':', '.') || ', duration ' || durationHours || ' h, '"
+        " || reservedResource FROM reservations WHERE durationHours >= 3 ORDER BY rowid"
+    ),
+    "statuses": (
+        "SELECT name || ' → ' || CASE confirmed WHEN 1 THEN 'Confirmed' ELSE 'NOT Confirmed' END"
+        " FROM reservations ORDER BY rowid"
+    ),
+}
+
+
+def database_file_for(reservation_file: str) -> str:
+    """Returns the name of the database of a reservation file"""
+    return reservation_file + ".db"
+
+
+def connect(database_file: str) -> sqlite3.Connection:
+    """
+    Opens a database and creates the tables if they do not exist
+
+    Parameters:
+     database_file (str): Name of the database file, ":memory:" for a temporary database
+    """
+    connection = sqlite3.connect(database_file)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def database_rows(reservation_file: str) -> Iterator[list]:
+    """
+    Reads and converts the reservations one at a time for the database
+
+    The values are converted with convert_reservation_data(), so invalid
+    lines raise the same errors as fetch_reservations(), and the dates
+    and times are stored in ISO format.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+    """
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(line) > 1:
+                reservation = convert_reservation_data(line.split("|"))
+                reservation[4] = reservation[4].isoformat()
+                reservation[5] = reservation[5].strftime("%H:%M")
+                reservation[8] = int(reservation[8])
+                reservation[10] = reservation[10].isoformat(sep=" ")
+                yield reservation
+
+
+def import_reservations(connection: sqlite3.Connection, reservation_file: str) -> int:
+    """
+    Replaces the reservations of the database with those of a file
+
+    Everything is done in one transaction: if a line of the file is
+    invalid, the database keeps the previous reservations.
+
+    Parameters:
+     connection (sqlite3.Connection): Open database
+     reservation_file (str): Name of the file containing the reservations
+
+    Returns:
+     count (int): Number of imported reservations
+    """
+    path, size, mtime = source_key(reservation_file)
+    with connection:
+        # sqlite3 does not begin a transaction before DROP INDEX by itself,
+        # and the dropped indexes must come back if the import fails
+        connection.execute("BEGIN")
+        for name in INDEXES:
+            connection.execute(f"DROP INDEX IF EXISTS {name}")
+        connection.execute("DELETE FROM reservations")
+        connection.executemany(
+            "INSERT INTO reservations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            database_rows(reservation_file),
+        )
+        for name, column in INDEXES.items():
+            connection.execute(f"CREATE INDEX {name} ON reservations ({column})")
+        connection.execute("DELETE FROM source")
+        connection.execute("INSERT INTO source VALUES (?, ?, ?, ?)", (DATABASE_VERSION, path, size, mtime))
+    connection.execute("ANALYZE")
+    return connection.execute("SELECT COUNT(*) FROM reservations").fetchone()[0]
+
+
+def has_indexes(connection: sqlite3.Connection) -> bool:
+    """Tells if all the indexes of INDEXES exist"""
+    names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    return names.issuperset(INDEXES)
+
+
+def is_up_to_date(connection: sqlite3.Connection, reservation_file: str) -> bool:
+    """
+    Tells if the database has the current version of the reservation file
+    and all of its indexes
+    """
+    row = connection.execute("SELECT version, path, size, mtime FROM source").fetchone()
+    if row is None or row[0] != DATABASE_VERSION or tuple(row[1:]) != source_key(reservation_file):
+        return False
+    return has_indexes(connection)
+
+
+def open_reservations(reservation_file: str, database_file: str | None = None) -> sqlite3.Connection:
+    """
+    Opens the database of a reservation file, importing the file first
+    if the database is missing or older than the file
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     database_file (str): Name of the database, by default reservation_file + ".db"
+    """
+    connection = connect(database_file or database_file_for(reservation_file))
+    if not is_up_to_date(connection, reservation_file):
+        import_reservations(connection, reservation_file)
+    return connection
+
+
+def to_reservation(row: tuple) -> list:
+    """
+    Converts a database row to a reservation in the format of
+    convert_reservation_data()
+    """
+    return convert_reservation_data(
+        [str(row[0]), *row[1:4], row[4], row[5], str(row[6]), repr(row[7]), str(bool(row[8])), row[9], row[10]]
+    )
+
+
+def find_by_date_range(
+    connection: sqlite3.Connection, start: date, end: date, resource: str | None = None
+) -> list[list]:
+    """
+    Returns the reservations from start to end (inclusive) in date order,
+    using the indexes on reservationDate and reservedResource
+
+    Parameters:
+     connection (sqlite3.Connection): Open database
+     start (date): First date
+     end (date): Last date
+     resource (str | None): Only reservations of this resource
+    """
+    query = "SELECT * FROM reservations WHERE reservationDate BETWEEN ? AND ?"
+    parameters: list = [start.isoformat(), end.isoformat()]
+    if resource is not None:
+        query += " AND reservedResource = ?"
+        parameters.append(resource)
+    rows = connection.execute(query + " ORDER BY reservationDate, rowid", parameters)
+    return [to_reservation(row) for row in rows]
+
+
+class SqliteReport:
+    """
+    The report sections of report_engine.ReportAccumulator answered by SQL
+    queries, for write_report() of report_output.py
+
+    Parameters:
+     connection (sqlite3.Connection): Open database
+     sections (Iterable[str]): Section keys, all sections by default
+    """
+
+    def __init__(self, connection: sqlite3.Connection, sections: Iterable[str] | None = None):
+        selected = set(SECTIONS) if sections is None else set(sections)
+        for section in selected:
+            if section not in SECTIONS:
+                raise ValueError(f"Unknown report section: {section}")
+        self.connection = connection
+        self.sections = [section for section in SECTIONS if section in selected]
+
+    def counts(self) -> tuple[int, int]:
+        """Returns the numbers of confirmed and not confirmed reservations"""
+        total, confirmed = self.connection.execute("SELECT COUNT(*), TOTAL(confirmed) FROM reservations").fetchone()
+        return int(confirmed), total - int(confirmed)
+
+    def revenue(self) -> float:
+        """Returns the revenue from confirmed reservations"""
+        query = "SELECT TOTAL(durationHours * price) FROM reservations WHERE confirmed = 1"
+        return self.connection.execute(query).fetchone()[0]
+
+    def section_lines(self, section: str) -> Iterator[str]:
+        """
+        Returns the lines of one section without its heading
+
+        Parameters:
+         section (str): Section key
+        """
+        if section in LINE_QUERIES:
+            for (line,) in self.connection.execute(LINE_QUERIES[section]):
+                yield line
+        elif section == "summary":
+            yield format_summary(*self.counts())
+        elif section == "revenue":
+            yield format_revenue(self.revenue())
+
+    def section_rows(self, section: str) -> Iterator[tuple]:
+        """
+        Returns the rows of one section as tuples for CSV and JSON output,
+        with the values in the order of SECTION_FIELDS in report_output.py
+
+        Parameters:
+         section (str): Section key
+        """
+        if section in ROW_QUERIES:
+            for row in self.connection.execute(ROW_QUERIES[section]):
+                yield (row[0], row[1], row[2], row[3], row[4], bool(row[5]), row[6])
+        elif section == "summary":
+            yield self.counts()
+        elif section == "revenue":
+            yield (round(self.revenue(), 2),)
+
+    def lines(self) -> Iterator[str]:
+        """Returns the headings and lines of all selected sections in order"""
+        for section in self.sections:
+            yield SECTIONS[section]
+            yield from self.section_lines(section)
+
+
+def main():
+    """Imports the reservations if needed and prints the selected report sections"""
+    parser = argparse.ArgumentParser(description="Print reservation reports from an SQLite database")
+    parser.add_argument("file", nargs="?", default="reservations.txt", help="reservation file")
+    parser.add_argument("--database", default=None, help="database file (default: <file>.db)")
+    parser.add_argument(
+        "--sections",
+        type=parse_sections,
+        default=None,
+        help="sections to print, e.g. 1,4,5 or summary,revenue (default: all)",
+    )
+    parser.add_argument("--format", choices=FORMATS, default="text", help="output format (default: text)")
+    parser.add_argument("--output", default=None, help="output file (default: stdout)")
+    args = parser.parse_args()
+
+    connection = open_reservations(args.file, args.database)
+    try:
+        stream = open_output(args.output)
+        try:
+            with ReportWriter(stream, args.format) as writer:
+                write_report(SqliteReport(connection, args.sections), writer)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
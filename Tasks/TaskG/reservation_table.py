@@ -0,0 +1,375 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+A compact, column-based store for reservations
+
+fetch_reservations() keeps one Python list per reservation, and every value in
+that list is a separate Python object. ReservationTable keeps one column per
+field instead:
+
+reservationId    -> array('i')
+name, email, phone -> StringColumn, UTF-8 bytes + array('q') of offsets
+reservationDate  -> array('i'), days since 1970-01-01
+reservationTime  -> array('i'), seconds since midnight
+durationHours    -> array('i')
+price            -> array('d')
+confirmed        -> bytearray, one byte per reservation
+reservedResource -> array('i') of ids + list of distinct resource names
+createdAt        -> array('q'), seconds since 1970-01-01 00:00:00
+
+A row is read back through ReservationRow, which supports both list indices
+(reservation[8]) and field names (reservation["confirmed"]). With the header
+row kept at index 0 (the default), the report functions of read_reservations.py
+work on a table without any changes.
+
+Run this file to compare memory use against fetch_reservations():
+
+python reservation_table.py [reservations.txt] [rows]
+"""
+
+import sys
+import tempfile
+from array import array
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+
+from read_reservations import (
+    HEADERS,
+    confirmation_summary,
+    convert_reservation_data,
+    fetch_reservations,
+    total_revenue,
+)
+
+COLUMNS = {name: index for index, name in enumerate(HEADERS)}
+
+EPOCH_DATE = date(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH_DATE.toordinal()
+EPOCH_DATETIME = datetime(1970, 1, 1)
+
+
+class StringColumn(Sequence):
+    """
+    Strings stored back to back in one UTF-8 buffer
+
+    A Python str costs about 50 bytes plus its text, so a column of short
+    names and emails is mostly object overhead. Here each string costs
+    its text plus one 8-byte offset.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+
+    def append(self, text: str) -> None:
+        """Adds one string to the end of the column"""
+        self.data += text.encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def nbytes(self) -> int:
+        """Returns the size of the buffer and the offsets"""
+        return sys.getsizeof(self.data) + sys.getsizeof(self.offsets)
+
+
+class ReservationRow(Sequence):
+    """
+    Read-only view of one reservation stored in a ReservationTable
+
+    Values are rebuilt from the columns on access, so a row costs only
+    a reference to the table and a position.
+    """
+
+    __slots__ = ("_table", "_position")
+
+    def __init__(self, table: "ReservationTable", position: int):
+        self._table = table
+        self._position = position
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            column = COLUMNS[key]
+        elif isinstance(key, slice):
+            return [self[column] for column in range(len(HEADERS))[key]]
+        else:
+            column = key + len(HEADERS) if key < 0 else key
+            if not 0 <= column < len(HEADERS):
+                raise IndexError("reservation column out of range")
+        return self._table.value(self._position, column)
+
+    def __len__(self) -> int:
+        return len(HEADERS)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def keys(self) -> list[str]:
+        """Returns the field names, so a row can also be used like a dict"""
+        return list(HEADERS)
+
+    def to_list(self) -> list:
+        """Returns the row in the same form as convert_reservation_data()"""
+        return list(self)
+
+    def to_dict(self) -> dict:
+        """Returns the row as a dictionary keyed by the field names"""
+        return dict(zip(HEADERS, self))
+
+
+class TableSlice(Sequence):
+    """
+    A slice of a ReservationTable, e.g. reservations[1:]
+
+    Slicing does not copy the columns, it only remembers the positions.
+    """
+
+    __slots__ = ("_table", "_positions")
+
+    def __init__(self, table: "ReservationTable", positions: range):
+        self._table = table
+        self._positions = positions
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TableSlice(self._table, self._positions[index])
+        return self._table[self._positions[index]]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class ReservationTable(Sequence):
+    """
+    Column-based reservation storage
+
+    Parameters:
+     header (bool): Keep the header row at index 0 like fetch_reservations()
+    """
+
+    def __init__(self, header: bool = True):
+        self.header = header
+        self.ids = array("i")
+        self.names = StringColumn()
+        self.emails = StringColumn()
+        self.phones = StringColumn()
+        self.dates = array("i")
+        self.times = array("i")
+        self.durations = array("i")
+        self.prices = array("d")
+        self.confirmed = bytearray()
+        self.resource_ids = array("i")
+        self.resources: list[str] = []
+        self.resource_lookup: dict[str, int] = {}
+        self.created = array("q")
+
+    def append(self, reservation: list) -> None:
+        """
+        Adds one converted reservation to the end of the table
+
+        Parameters:
+         reservation (list): Reservation from convert_reservation_data()
+        """
+        resource = reservation[9]
+        resource_id = self.resource_lookup.get(resource)
+        if resource_id is None:
+            resource_id = len(self.resources)
+            self.resource_lookup[resource] = resource_id
+            self.resources.append(resource)
+
+        reservation_time = reservation[5]
+        created = reservation[10] - EPOCH_DATETIME
+
+        self.ids.append(reservation[0])
+        self.names.append(reservation[1])
+        self.emails.append(reservation[2])
+        self.phones.append(reservation[3])
+        self.dates.append(reservation[4].toordinal() - EPOCH_ORDINAL)
+        self.times.append(
+            reservation_time.hour * 3600
+            + reservation_time.minute * 60
+            + reservation_time.second
+        )
+        self.durations.append(reservation[6])
+        self.prices.append(reservation[7])
+        self.confirmed.append(1 if reservation[8] else 0)
+        self.resource_ids.append(resource_id)
+        self.created.append(created.days * 86400 + created.seconds)
+
+    def value(self, position: int, column: int):
+        """
+        Returns one field of one reservation as the same type that
+        convert_reservation_data() produces
+
+        Parameters:
+         position (int): Reservation position, header row not counted
+         column (int): Column index, see HEADERS
+        """
+        if column == 0:
+            return self.ids[position]
+        if column == 1:
+            return self.names[position]
+        if column == 2:
+            return self.emails[position]
+        if column == 3:
+            return self.phones[position]
+        if column == 4:
+            return date.fromordinal(EPOCH_ORDINAL + self.dates[position])
+        if column == 5:
+            seconds = self.times[position]
+            return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+        if column == 6:
+            return self.durations[position]
+        if column == 7:
+            return self.prices[position]
+        if column == 8:
+            return self.confirmed[position] == 1
+        if column == 9:
+            return self.resources[self.resource_ids[position]]
+        return EPOCH_DATETIME + timedelta(seconds=self.created[position])
+
+    def row_count(self) -> int:
+        """Returns the number of reservations, header row not counted"""
+        return len(self.ids)
+
+    def __len__(self) -> int:
+        return self.row_count() + (1 if self.header else 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TableSlice(self, range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("reservation index out of range")
+        if self.header:
+            if index == 0:
+                return list(HEADERS)
+            index -= 1
+        return ReservationRow(self, index)
+
+    def nbytes(self) -> int:
+        """Returns the size of the column buffers and the strings they refer to"""
+        size = self.names.nbytes() + self.emails.nbytes() + self.phones.nbytes()
+        size += sys.getsizeof(self.resource_lookup)
+        size += sum(
+            sys.getsizeof(column)
+            for column in (
+                self.ids,
+                self.dates,
+                self.times,
+                self.durations,
+                self.prices,
+                self.confirmed,
+                self.resource_ids,
+                self.created,
+            )
+        )
+        size += sys.getsizeof(self.resources)
+        size += sum(sys.getsizeof(resource) for resource in self.resources)
+        return size
+
+
+def fetch_reservation_table(reservation_file: str, header: bool = True) -> ReservationTable:
+    """
+    Reads reservations from a file into a ReservationTable
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     header (bool): Keep the header row at index 0 like fetch_reservations()
+
+    Returns:
+     table (ReservationTable): Read and converted reservations
+    """
+    table = ReservationTable(header)
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(line) > 1:
+                table.append(convert_reservation_data(line.split("|")))
+    return table
+
+
+def write_repeated_file(source_file: str, target_file: str, rows: int) -> None:
+    """
+    Writes a larger reservation file by repeating the rows of a small one
+
+    Parameters:
+     source_file (str): File whose rows are repeated
+     target_file (str): File to create
+     rows (int): Number of rows to write
+    """
+    with open(source_file, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if len(line) > 1]
+    with open(target_file, "w", encoding="utf-8") as f:
+        for i in range(rows):
+            fields = lines[i % len(lines)].split("|")
+            fields[0] = str(i + 1)
+            f.write("|".join(fields) + "\n")
+
+
+def list_nbytes(reservations: list[list]) -> int:
+    """
+    Returns the size of a list of lists and every distinct value in it
+
+    Parameters:
+     reservations (list): Reservations from fetch_reservations()
+
+    Returns:
+     size (int): Size in bytes
+    """
+    seen = set()
+    size = sys.getsizeof(reservations)
+    for reservation in reservations:
+        size += sys.getsizeof(reservation)
+        for value in reservation:
+            # Small ints and True/False are shared objects, count them once
+            if id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+    return size
+
+
+def main():
+    """
+    Compares the memory use of fetch_reservations() and
+    fetch_reservation_table() and checks that the reports match
+    """
+    source_file = sys.argv[1] if len(sys.argv) > 1 else "reservations.txt"
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    with tempfile.TemporaryDirectory() as folder:
+        reservation_file = f"{folder}/reservations.txt"
+        write_repeated_file(source_file, reservation_file, rows)
+        as_lists = fetch_reservations(reservation_file)
+        as_table = fetch_reservation_table(reservation_file)
+    list_size = list_nbytes(as_lists)
+    table_size = as_table.nbytes()
+
+    print(f"Reservations: {rows}")
+    print(f"- list of lists: {list_size / 1024 / 1024:.2f} MiB")
+    print(f"- ReservationTable: {table_size / 1024 / 1024:.2f} MiB")
+    print(f"- ReservationTable is {list_size / table_size:.1f} times smaller")
+    print("Reports from the list of lists:")
+    confirmation_summary(as_lists)
+    total_revenue(as_lists)
+    print("Reports from the ReservationTable:")
+    confirmation_summary(as_table)
+    total_revenue(as_table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Follows a growing reservations.txt and keeps the report totals up to date
+
+reservations.txt only grows: new reservations are appended to the end.
+ReservationTail remembers the byte position it has read up to, and each
+poll() reads only the bytes after it. The new rows are added to a
+ReportAccumulator, so updating the confirmed and unconfirmed counts, the
+total revenue and the long reservations costs time for the new rows only.
+
+Only rows that end in a line break are counted while the file is followed.
+reservations.txt has no line break after its last row, so that row is
+counted when the next row is appended or when the program is stopped.
+
+python reservation_tail.py [reservations.txt] [--interval 2]
+"""
+
+import argparse
+import os
+import time
+
+from read_reservations import convert_reservation_data, format_long, format_revenue, format_summary
+from report_engine import ReportAccumulator
+
+TAIL_SECTIONS = ["long", "summary", "revenue"]
+
+
+class ReservationTail:
+    """
+    Reads the reservations appended to a file since the last poll
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     sections (list[str]): Report sections to keep up to date
+    """
+
+    # Bytes before the offset that are compared on every poll to notice a rewritten file
+    CHECK_BYTES = 64
+    # Bytes read at a time
+    CHUNK_BYTES = 1 << 20
+
+    def __init__(self, reservation_file: str, sections: list[str] | None = None):
+        self.reservation_file = reservation_file
+        self.sections = TAIL_SECTIONS if sections is None else sections
+        self.skipped: list[tuple[int, str]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Starts again from the beginning, e.g. if the file was replaced"""
+        self.report = ReportAccumulator(self.sections)
+        self.offset = 0
+        self.line_number = 0
+        self.inode: int | None = None
+        self.checked = b""  # The bytes just before the offset
+
+    def replaced(self, stat: os.stat_result, checked: bytes) -> bool:
+        """
+        Tells if the file is not the one read so far: it has another inode,
+        it is shorter than the offset, or the bytes before the offset changed
+        """
+        if self.inode is not None and stat.st_ino != self.inode:
+            return True
+        return stat.st_size < self.offset or checked != self.checked
+
+    def add_line(self, line: bytes, new_reservations: list[list]) -> None:
+        """
+        Converts one complete line and adds it to the report
+
+        A line that cannot be converted is recorded in skipped with its
+        line number and the error, and the following lines are still read.
+        """
+        self.line_number += 1
+        try:
+            text = line.decode("utf-8").rstrip("\r")
+            if text:
+                new_reservations.append(convert_reservation_data(text.split("|")))
+        except (UnicodeDecodeError, IndexError, ValueError) as e:
+            self.skipped.append((self.line_number, str(e)))
+
+    def commit(self, data: bytes) -> None:
+        """Moves the offset past data that has been read and added"""
+        self.offset += len(data)
+        self.checked = (self.checked + data[-self.CHECK_BYTES:])[-self.CHECK_BYTES:]
+
+    def poll(self, final: bool = False) -> list[list]:
+        """
+        Reads and adds the reservations appended since the previous poll
+
+        Only complete lines are read: a line without a line break may still
+        be being written, and a prefix of it, such as a createdAt of
+        2025-08-12 14:33:2, can look like a valid reservation. It is left
+        for the next poll, unless final is True, which is meant for the last
+        poll when the program stops. Complete lines that cannot be converted
+        are skipped and recorded in skipped.
+
+        The new bytes are read in pieces of CHUNK_BYTES, so the memory used
+        for reading does not depend on the size of the file.
+
+        Parameters:
+         final (bool): Also read a last line without a line break
+
+        Returns:
+         new_reservations (list[list]): Reservations added in this poll
+        """
+        new_reservations = []
+        with open(self.reservation_file, "rb") as f:
+            stat = os.fstat(f.fileno())
+            f.seek(self.offset - len(self.checked))
+            checked = f.read(len(self.checked))
+            if self.replaced(stat, checked):
+                self.reset()
+                f.seek(0)
+            self.inode = stat.st_ino
+            # Bytes appended while reading are left for the next poll
+            remaining = stat.st_size - self.offset
+            pending = b""
+            while remaining > 0:
+                chunk = f.read(min(self.CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                data = pending + chunk
+                end = data.rfind(b"\n") + 1
+                if end:
+                    for line in data[: end - 1].split(b"\n"):
+                        self.add_line(line, new_reservations)
+                    self.commit(data[:end])
+                pending = data[end:]
+        if final and pending:
+            self.add_line(pending, new_reservations)
+            self.commit(pending)
+        for reservation in new_reservations:
+            self.report.add(reservation)
+        return new_reservations
+
+
+def print_update(tail: ReservationTail, new_reservations: list[list]) -> None:
+    """
+    Prints the totals after new reservations have been read
+
+    Parameters:
+     tail (ReservationTail): Followed file
+     new_reservations (list[list]): Reservations added in the latest poll
+    """
+    report = tail.report
+    print(f"{len(new_reservations)} new reservations, {report.total_count} in total")
+    print(format_summary(report.confirmed_count, report.total_count - report.confirmed_count))
+    print(format_revenue(report.revenue))
+    for reservation in new_reservations:
+        if reservation[6] >= 3:
+            print(f"New long reservation {format_long(reservation)}")
+
+
+def print_skipped(tail: ReservationTail, shown: int) -> int:
+    """
+    Prints the lines skipped since the previous call
+
+    Parameters:
+     tail (ReservationTail): Followed file
+     shown (int): Number of skipped lines already printed
+
+    Returns:
+     shown (int): Number of skipped lines printed so far
+    """
+    for line_number, error in tail.skipped[shown:]:
+        print(f"Skipped invalid line {line_number}: {error}")
+    return len(tail.skipped)
+
+
+def follow(reservation_file: str, interval: float) -> None:
+    """
+    Polls the file until CTRL-C and prints the totals whenever it grows
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     interval (float): Seconds between polls
+    """
+    tail = ReservationTail(reservation_file)
+    print_update(tail, tail.poll())
+    shown = print_skipped(tail, 0)
+    try:
+        while True:
+            time.sleep(interval)
+            new_reservations = tail.poll()
+            shown = print_skipped(tail, shown)
+            if new_reservations:
+                print_update(tail, new_reservations)
+    except KeyboardInterrupt:
+        print("\nYou pressed CTRL-C")
+    # The last line may have no line break, it is read once the file is no longer followed
+    new_reservations = tail.poll(final=True)
+    print_skipped(tail, shown)
+    if new_reservations:
+        print_update(tail, new_reservations)
+
+
+def main():
+    """Follows the reservation file given on the command line"""
+    parser = argparse.ArgumentParser(description="Follow a growing reservation file")
+    parser.add_argument("file", nargs="?", default="reservations.txt", help="reservation file")
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds between polls")
+    args = parser.parse_args()
+    follow(args.file, args.interval)
+
+
+if __name__ == "__main__":
+    main()